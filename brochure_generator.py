@@ -17,11 +17,18 @@ from tkinter import ttk, filedialog, messagebox, colorchooser, font as tkfont
 from PIL import Image, ImageDraw, ImageFont, ImageTk, ImageFilter, ImageEnhance
 import os
 import io
+import copy
 import json
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Callable
 from enum import Enum
+from types import SimpleNamespace
 import math
 
 # Try to import reportlab for PDF generation
@@ -56,6 +63,37 @@ A5_EXPORT_HEIGHT = 2480
 A4_EXPORT_WIDTH = 2480
 A4_EXPORT_HEIGHT = 3508
 
+# Maximum number of rasterized text blocks kept by each renderer
+TEXT_ATLAS_SIZE = 128
+
+# Maximum number of pages whose preview renders are kept by the app
+PAGE_CACHE_SIZE = 16
+
+# Maximum number of preview sizes kept per page (e.g. single view, spread and print thumbnails)
+PAGE_CACHE_SIZES = 4
+
+# Quiet period (ms) before typed text or a dragged slider is applied to the element
+EDIT_DEBOUNCE_MS = 150
+
+# Quiet period (ms) after the last canvas resize event before the preview is redrawn
+RESIZE_DEBOUNCE_MS = 100
+
+# Interval (ms) at which a running PDF export checks its workers for finished pages
+EXPORT_POLL_MS = 50
+
+# Below this canvas width or height (px) the preview would be illegible, so it isn't rendered
+MIN_PREVIEW_CANVAS = 100
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_hex_color(hex_color: str) -> Tuple[int, int, int]:
+    """Convert a '#rrggbb' or '#rgb' color to an RGB tuple (cached per string)"""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 3:
+        hex_color = ''.join([c*2 for c in hex_color])
+    value = int(hex_color, 16)
+    return (value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff
+
 
 class PageCount(Enum):
     ONE = 1
@@ -121,6 +159,7 @@ class PageData:
     text_elements: List[TextElement] = field(default_factory=list)
     image_elements: List[ImageElement] = field(default_factory=list)
     shape_elements: List[ShapeElement] = field(default_factory=list)
+    version: int = field(default=0, compare=False, repr=False)  # Bumped on every edit to the page
 
 
 @dataclass
@@ -489,6 +528,22 @@ class BrochureRenderer:
         self.width = A5_PREVIEW_WIDTH if preview_mode else A5_EXPORT_WIDTH
         self.height = A5_PREVIEW_HEIGHT if preview_mode else A5_EXPORT_HEIGHT
 
+        # Preview frames are shown on screen and redrawn often, so trade
+        # sharpness for speed there; export keeps the full-quality Lanczos path
+        self._resize_filter = Image.Resampling.BILINEAR if preview_mode else Image.Resampling.LANCZOS
+
+        # Rasterized (unrotated) text blocks, reused for repeated text (LRU)
+        self._text_atlas: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+
+        # Page buffer reused across renders, (re)allocated lazily when the size changes
+        self._canvas: Optional[Image.Image] = None
+
+        # Opened FreeType fonts keyed by (font file key, pixel size)
+        self._font_cache: Dict[Tuple[str, int], Any] = {}
+
+        # Scratch draw context used only to measure text blocks
+        self._measure_draw = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+
         # Try to load fonts
         self.fonts = {}
         self._load_fonts()
@@ -543,6 +598,14 @@ class BrochureRenderer:
         # Try to find the requested font
         font_key = family.lower() + ".ttf"
 
+        # Opening a TrueType file is far slower than drawing with it, so keep them around
+        font = self._font_cache.get((font_key, size))
+        if font is None:
+            font = self._font_cache[(font_key, size)] = self._open_font(font_key, size)
+        return font
+
+    def _open_font(self, font_key: str, size: int):
+        """Open the font for a key at a pixel size, falling back to the default fonts"""
         if font_key in self.fonts:
             try:
                 return ImageFont.truetype(self.fonts[font_key], size)
@@ -561,10 +624,7 @@ class BrochureRenderer:
 
     def hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) == 3:
-            hex_color = ''.join([c*2 for c in hex_color])
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return parse_hex_color(hex_color)
 
     def hex_to_rgba(self, hex_color: str, alpha: float = 1.0) -> Tuple[int, int, int, int]:
         """Convert hex color to RGBA tuple"""
@@ -604,55 +664,78 @@ class BrochureRenderer:
 
         return img
 
+    def _get_canvas(self) -> Image.Image:
+        """Get the reusable RGBA page buffer for the current render size"""
+        if self._canvas is None or self._canvas.size != (self.width, self.height):
+            self._canvas = Image.new('RGBA', (self.width, self.height))
+        return self._canvas
+
+    @staticmethod
+    def _composite(img: Image.Image, overlay: Image.Image, x: int, y: int):
+        """Alpha-composite an RGBA overlay onto img at (x, y), clipping at the page edges"""
+        # alpha_composite rejects negative offsets, so crop the overlay instead
+        left = max(0, -x)
+        top = max(0, -y)
+        if left >= overlay.width or top >= overlay.height or x >= img.width or y >= img.height:
+            return
+        img.alpha_composite(overlay, dest=(max(x, 0), max(y, 0)), source=(left, top))
+
     def render_page(self, page: PageData) -> Image.Image:
         """Render a single page to an image with layer support"""
-        # Create base image with background
+        # Reset the shared RGBA buffer with the page background
+        img = self._get_canvas()
         if page.background_gradient:
-            img = self.create_gradient(*page.background_gradient)
+            img.paste(self.create_gradient(*page.background_gradient), (0, 0))
         else:
-            img = Image.new('RGB', (self.width, self.height), self.hex_to_rgb(page.background_color))
+            img.paste(self.hex_to_rgba(page.background_color), (0, 0, self.width, self.height))
 
-        # Convert to RGBA for compositing
-        img = img.convert('RGBA')
+        # Percent -> pixel factors, computed once for the whole page
+        sx = self.width / 100
+        sy = self.height / 100
 
-        # Collect all elements with their layer indices for z-ordering
+        # Collect all elements with their layer indices and pixel geometry for z-ordering
         all_elements = []
 
         # Add shapes
         for shape in page.shape_elements:
-            layer_idx = getattr(shape, 'layer_index', 0)
-            all_elements.append(('shape', shape, layer_idx))
+            layer_idx = shape.layer_index
+            geometry = (int(shape.x * sx), int(shape.y * sy), int(shape.width * sx), int(shape.height * sy))
+            all_elements.append(('shape', shape, layer_idx, geometry))
 
         # Add images
         for image in page.image_elements:
-            layer_idx = getattr(image, 'layer_index', 0)
-            all_elements.append(('image', image, layer_idx))
+            layer_idx = image.layer_index
+            geometry = (int(image.x * sx), int(image.y * sy), int(image.width * sx), int(image.height * sy))
+            all_elements.append(('image', image, layer_idx, geometry))
 
         # Add text elements
         for text in page.text_elements:
-            layer_idx = getattr(text, 'layer_index', 0)
-            all_elements.append(('text', text, layer_idx))
+            layer_idx = text.layer_index
+            geometry = (int(text.x * sx), int(text.y * sy))
+            all_elements.append(('text', text, layer_idx, geometry))
 
         # Sort by layer index (lower layers rendered first, higher on top)
-        all_elements.sort(key=lambda x: x[2])
+        all_elements.sort(key=itemgetter(2))
 
         # Render each element in order
-        for elem_type, elem, _ in all_elements:
+        for elem_type, elem, _, geometry in all_elements:
             if elem_type == 'shape':
-                img = self._render_shape_to_image(img, elem)
+                img = self._render_shape_to_image(img, elem, geometry)
             elif elem_type == 'image':
-                img = self._render_image_element(img, elem)
+                img = self._render_image_element(img, elem, geometry)
             elif elem_type == 'text':
-                img = self._render_text_to_image(img, elem)
+                img = self._render_text_to_image(img, elem, geometry)
 
+        # convert() returns a new image, so the shared buffer never leaves the renderer
         return img.convert('RGB')
 
-    def _render_shape_to_image(self, img: Image.Image, shape: ShapeElement) -> Image.Image:
+    def _render_shape_to_image(self, img: Image.Image, shape: ShapeElement,
+                               xywh: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
         """Render a shape element with rotation support"""
-        x = int(shape.x / 100 * self.width)
-        y = int(shape.y / 100 * self.height)
-        w = int(shape.width / 100 * self.width)
-        h = int(shape.height / 100 * self.height)
+        if xywh is None:
+            xywh = (int(shape.x / 100 * self.width), int(shape.y / 100 * self.height),
+                    int(shape.width / 100 * self.width), int(shape.height / 100 * self.height))
+        x, y, w, h = xywh
 
         # Create a temporary image for the shape (larger to accommodate rotation)
         padding = max(w, h)
@@ -689,19 +772,25 @@ class BrochureRenderer:
             temp_draw.line([(cx - w // 2, cy), (cx + w // 2, cy)], fill=fill, width=shape.stroke_width)
 
         # Apply rotation if needed
-        rotation = getattr(shape, 'rotation', 0)
+        rotation = shape.rotation
         if rotation != 0:
             temp_img = temp_img.rotate(-rotation, resample=Image.Resampling.BICUBIC, expand=False)
 
         # Paste onto main image
         paste_x = x - temp_size[0] // 2
         paste_y = y - temp_size[1] // 2
-        img.paste(temp_img, (paste_x, paste_y), temp_img)
+        self._composite(img, temp_img, paste_x, paste_y)
 
         return img
 
-    def _render_image_element(self, img: Image.Image, image_elem: ImageElement) -> Image.Image:
+    def _render_image_element(self, img: Image.Image, image_elem: ImageElement,
+                              xywh: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
         """Render an image element with rotation, resize, and opacity support"""
+        if xywh is None:
+            xywh = (int(image_elem.x / 100 * self.width), int(image_elem.y / 100 * self.height),
+                    int(image_elem.width / 100 * self.width), int(image_elem.height / 100 * self.height))
+        center_x, center_y, target_w, target_h = xywh
+
         try:
             # Load image from path or data
             if image_elem.image_path and os.path.exists(image_elem.image_path):
@@ -711,107 +800,116 @@ class BrochureRenderer:
             else:
                 return img
 
+            if target_w <= 0 or target_h <= 0:
+                return img
+
             # Convert to RGBA
             source_img = source_img.convert('RGBA')
+            src_w, src_h = source_img.size
 
-            # Calculate target size
-            target_w = int(image_elem.width / 100 * self.width)
-            target_h = int(image_elem.height / 100 * self.height)
-
-            # Resize based on fit mode
+            # Work out the placed (unrotated) size and the source region shown in it
             if image_elem.fit_mode == "stretch":
-                source_img = source_img.resize((target_w, target_h), Image.Resampling.LANCZOS)
+                box_w, box_h = target_w, target_h
+                src_box = (0, 0, src_w, src_h)
             elif image_elem.fit_mode == "contain":
-                source_img.thumbnail((target_w, target_h), Image.Resampling.LANCZOS)
+                # Keep the aspect ratio and never enlarge (same as thumbnail())
+                scale = min(target_w / src_w, target_h / src_h, 1.0)
+                box_w, box_h = max(1, round(src_w * scale)), max(1, round(src_h * scale))
+                src_box = (0, 0, src_w, src_h)
             else:  # cover
-                # Scale to cover the target area
-                img_ratio = source_img.width / source_img.height
-                target_ratio = target_w / target_h
-                if img_ratio > target_ratio:
-                    new_h = target_h
-                    new_w = int(new_h * img_ratio)
-                else:
-                    new_w = target_w
-                    new_h = int(new_w / img_ratio)
-                source_img = source_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                # Crop to target size
-                left = (source_img.width - target_w) // 2
-                top = (source_img.height - target_h) // 2
-                source_img = source_img.crop((left, top, left + target_w, top + target_h))
+                # Scale to cover the target area and crop the overflow evenly
+                scale = max(target_w / src_w, target_h / src_h)
+                crop_w, crop_h = target_w / scale, target_h / scale
+                left, top = (src_w - crop_w) / 2, (src_h - crop_h) / 2
+                box_w, box_h = target_w, target_h
+                src_box = (left, top, left + crop_w, top + crop_h)
+
+            # Crop, resize and rotate in a single resampling pass
+            rotation = image_elem.rotation
+            if rotation % 360 == 0:
+                source_img = source_img.resize((box_w, box_h), self._resize_filter, box=src_box)
+            else:
+                source_img = self._resize_rotated(source_img, src_box, box_w, box_h, rotation)
 
             # Apply opacity
             if image_elem.opacity < 1.0:
-                alpha = source_img.split()[3]
+                alpha = source_img.getchannel('A')
                 alpha = alpha.point(lambda p: int(p * image_elem.opacity))
                 source_img.putalpha(alpha)
 
-            # Apply rotation
-            rotation = getattr(image_elem, 'rotation', 0)
-            if rotation != 0:
-                source_img = source_img.rotate(-rotation, resample=Image.Resampling.BICUBIC, expand=True)
-
             # Calculate position
-            x = int(image_elem.x / 100 * self.width) - source_img.width // 2
-            y = int(image_elem.y / 100 * self.height) - source_img.height // 2
+            x = center_x - source_img.width // 2
+            y = center_y - source_img.height // 2
 
             # Paste onto main image
-            img.paste(source_img, (x, y), source_img)
+            self._composite(img, source_img, x, y)
 
         except Exception as e:
             print(f"Error rendering image: {e}")
 
         return img
 
-    def _render_text_to_image(self, img: Image.Image, text_elem: TextElement) -> Image.Image:
-        """Render a text element with rotation support"""
-        font = self.get_font(text_elem.font_family, text_elem.font_size, text_elem.bold, text_elem.italic)
+    def _resize_rotated(self, source_img: Image.Image, src_box: Tuple[float, float, float, float],
+                        box_w: int, box_h: int, rotation: float) -> Image.Image:
+        """Scale src_box to box_w x box_h and rotate it clockwise with one affine transform"""
+        left, top, right, bottom = src_box
+        kx = (right - left) / box_w
+        ky = (bottom - top) / box_h
+
+        # The rotated bounding box also samples outside the placed box, so
+        # drop any source pixels the fit mode cropped away (cover)
+        crop = (math.floor(left), math.floor(top), math.ceil(right), math.ceil(bottom))
+        if crop != (0, 0) + source_img.size:
+            source_img = source_img.crop(crop)
+            left, top = left - crop[0], top - crop[1]
+
+        # The affine resample does not low-pass filter, so bring large
+        # downscales within 2x using a cheap box reduction first
+        factor = int(min(kx, ky) / 2)
+        if factor >= 2:
+            source_img = source_img.reduce(factor)
+            left, top = left / factor, top / factor
+            kx, ky = kx / factor, ky / factor
+
+        angle = math.radians(-rotation)
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+
+        # Size of the rotated bounding box (same as rotate(expand=True))
+        out_w = max(1, math.ceil(abs(box_w * cos_a) + abs(box_h * sin_a) - 1e-6))
+        out_h = max(1, math.ceil(abs(box_w * sin_a) + abs(box_h * cos_a) - 1e-6))
+        half_w, half_h = out_w / 2, out_h / 2
+
+        # Map each output pixel back through the rotation into the placed box, then into the source
+        matrix = (
+            kx * cos_a, -kx * sin_a, left + kx * (box_w / 2 - half_w * cos_a + half_h * sin_a),
+            ky * sin_a, ky * cos_a, top + ky * (box_h / 2 - half_w * sin_a - half_h * cos_a),
+        )
+        resample = Image.Resampling.BILINEAR if self.preview_mode else Image.Resampling.BICUBIC
+        return source_img.transform((out_w, out_h), Image.Transform.AFFINE, matrix, resample=resample)
 
+    def _render_text_to_image(self, img: Image.Image, text_elem: TextElement,
+                              xy: Optional[Tuple[int, int]] = None) -> Image.Image:
+        """Render a text element with rotation support"""
         # Calculate position
-        x = int(text_elem.x / 100 * self.width)
-        y = int(text_elem.y / 100 * self.height)
-
-        # Handle multiline text
-        lines = text_elem.text.split('\n')
+        if xy is None:
+            xy = (int(text_elem.x / 100 * self.width), int(text_elem.y / 100 * self.height))
+        x, y = xy
 
-        # Create temporary draw to measure text
-        temp_draw = ImageDraw.Draw(img)
+        # Reuse the rasterized block if the same text was rendered before
+        atlas_key = (text_elem.font_family, text_elem.font_size, text_elem.bold, text_elem.italic,
+                     self.width, text_elem.text, text_elem.font_color, text_elem.alignment)
+        text_img = self._text_atlas.get(atlas_key)
 
-        # Calculate total dimensions
-        line_heights = []
-        line_widths = []
-        for line in lines:
-            bbox = temp_draw.textbbox((0, 0), line, font=font)
-            line_heights.append(bbox[3] - bbox[1])
-            line_widths.append(bbox[2] - bbox[0])
-
-        total_height = sum(line_heights) + (len(lines) - 1) * 5
-        max_width = max(line_widths) if line_widths else 0
-
-        # Create temporary image for text (to support rotation)
-        padding = 20
-        temp_size = (max_width + padding * 2, total_height + padding * 2)
-        text_img = Image.new('RGBA', temp_size, (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_img)
-
-        fill_color = self.hex_to_rgb(text_elem.font_color)
-        current_y = padding
-
-        for i, line in enumerate(lines):
-            bbox = text_draw.textbbox((0, 0), line, font=font)
-            text_width = bbox[2] - bbox[0]
-
-            if text_elem.alignment == "center":
-                text_x = (temp_size[0] - text_width) // 2
-            elif text_elem.alignment == "right":
-                text_x = temp_size[0] - padding - text_width
-            else:  # left
-                text_x = padding
-
-            text_draw.text((text_x, current_y), line, font=font, fill=fill_color)
-            current_y += line_heights[i] + 5
+        if text_img is not None:
+            self._text_atlas.move_to_end(atlas_key)
+        else:
+            text_img = self._rasterize_text(text_elem)
+            self._text_atlas[atlas_key] = text_img
+            if len(self._text_atlas) > TEXT_ATLAS_SIZE:
+                self._text_atlas.popitem(last=False)
 
         # Apply rotation if needed
-        rotation = getattr(text_elem, 'rotation', 0)
+        rotation = text_elem.rotation
         if rotation != 0:
             text_img = text_img.rotate(-rotation, resample=Image.Resampling.BICUBIC, expand=True)
 
@@ -820,10 +918,32 @@ class BrochureRenderer:
         paste_y = y - text_img.height // 2
 
         # Paste onto main image
-        img.paste(text_img, (paste_x, paste_y), text_img)
+        self._composite(img, text_img, paste_x, paste_y)
 
         return img
 
+    def _rasterize_text(self, text_elem: TextElement) -> Image.Image:
+        """Draw a text element's lines onto a transparent, unrotated image"""
+        font = self.get_font(text_elem.font_family, text_elem.font_size, text_elem.bold, text_elem.italic)
+
+        # Measure the whole block; Pillow lays out the lines and alignment itself
+        left, top, right, bottom = self._measure_draw.multiline_textbbox(
+            (0, 0), text_elem.text, font=font, spacing=5, align=text_elem.alignment)
+        left, top = math.floor(left), math.floor(top)
+        right, bottom = math.ceil(right), math.ceil(bottom)
+
+        # Create temporary image for text (to support rotation)
+        padding = 20
+        temp_size = (right - left + padding * 2, bottom - top + padding * 2)
+        text_img = Image.new('RGBA', temp_size, (0, 0, 0, 0))
+        text_draw = ImageDraw.Draw(text_img)
+
+        fill_color = self.hex_to_rgb(text_elem.font_color)
+        text_draw.multiline_text((padding, padding), text_elem.text, font=font,
+                                 fill=fill_color, spacing=5, align=text_elem.alignment)
+
+        return text_img
+
     def _render_shape(self, draw: ImageDraw.Draw, shape: ShapeElement):
         """Render a shape element"""
         x = int(shape.x / 100 * self.width)
@@ -869,33 +989,36 @@ class BrochureRenderer:
         y = int(text_elem.y / 100 * self.height)
         max_width = int(text_elem.max_width / 100 * self.width)
 
-        # Handle multiline text
-        lines = text_elem.text.split('\n')
+        # Anchor the block horizontally at x, then center it vertically on y
+        anchor = {"center": "ma", "right": "ra"}.get(text_elem.alignment, "la")
+        bbox = draw.multiline_textbbox((x, y), text_elem.text, font=font, anchor=anchor,
+                                       spacing=5, align=text_elem.alignment)
+        total_height = int(bbox[3] - bbox[1])
+
+        fill_color = self.hex_to_rgb(text_elem.font_color)
+        draw.multiline_text((x, y - total_height // 2), text_elem.text, font=font, fill=fill_color,
+                            anchor=anchor, spacing=5, align=text_elem.alignment)
 
-        # Calculate total height
-        line_heights = []
-        for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_heights.append(bbox[3] - bbox[1])
 
-        total_height = sum(line_heights) + (len(lines) - 1) * 5
-        current_y = y - total_height // 2
+# Export renderer of a PDF worker process, created on first use so its font cache is shared by
+# every page the worker renders; the UI process never creates one, so it holds no export buffers
+_export_renderer: Optional[BrochureRenderer] = None
 
-        fill_color = self.hex_to_rgb(text_elem.font_color)
 
-        for i, line in enumerate(lines):
-            bbox = draw.textbbox((0, 0), line, font=font)
-            text_width = bbox[2] - bbox[0]
+def get_export_renderer() -> BrochureRenderer:
+    """Get this worker process's full-resolution export renderer"""
+    global _export_renderer
+    if _export_renderer is None:
+        _export_renderer = BrochureRenderer(preview_mode=False)
+    return _export_renderer
 
-            if text_elem.alignment == "center":
-                text_x = x - text_width // 2
-            elif text_elem.alignment == "right":
-                text_x = x - text_width
-            else:  # left
-                text_x = x
 
-            draw.text((text_x, current_y), line, font=font, fill=fill_color)
-            current_y += line_heights[i] + 5
+def render_page_to_rgb_bytes(page: PageData, width: int, height: int) -> bytes:
+    """Render a page at the given size and return its raw RGB pixels (runs in export worker processes)"""
+    renderer = get_export_renderer()
+    renderer.width = width
+    renderer.height = height
+    return renderer.render_page(page).tobytes()
 
 
 class BookletImposition:
@@ -1006,8 +1129,7 @@ class RealTimeColorPicker:
 
     def _hex_to_hsv(self, hex_color):
         """Convert hex color to HSV"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+        r, g, b = (c / 255.0 for c in parse_hex_color(hex_color))
 
         max_c = max(r, g, b)
         min_c = min(r, g, b)
@@ -1178,6 +1300,39 @@ class BrochureGeneratorApp:
         self.selected_element = None
         self.preview_mode = "single"  # single, spread, print
         self.renderer = BrochureRenderer(preview_mode=True)
+        self._pending_redraw = None  # after() id of the scheduled preview redraw
+        self._last_render_key = None  # what the preview canvas currently shows
+        self._dragging = False  # a slider is held; previews render at half resolution
+        self._canvas_size = None  # (width, height) from the last canvas <Configure> event
+        # Rendered previews: id(page) -> (page, version, {(width, height): image}), pages and sizes
+        # least recently used first; only the page's current version is kept
+        self._page_cache: "OrderedDict[int, Tuple[PageData, int, OrderedDict]]" = OrderedDict()
+        self._photo_sources: Dict[str, Image.Image] = {}  # PhotoImage attribute -> PIL image it shows
+        self._canvas_items: Dict[str, int] = {}  # persistent preview canvas items by role
+        self._drawn_items = set()  # roles drawn by the current redraw
+        self._item_args: Dict[str, Tuple] = {}  # (coords, options) each visible item was last drawn with
+        self._restacking = False  # an item of the current redraw was raised, so later ones must be too
+        self.preview_image = None
+        self.spread_left_image = self.spread_right_image = None
+        self.print_left_image = self.print_right_image = None
+        self._spread_pairs_for = -1  # page count _spread_pairs was computed for
+        self._spread_pairs: List[Tuple[int, int, str]] = []
+
+        # Refreshes suppressed inside _batch_updates(), flushed once on exit
+        self._batch_depth = 0
+        self._batch_dirty = set()
+
+        # Property panels are built once per element kind and reused across selections
+        self._props_panels: Dict[str, ttk.Frame] = {}
+        self._active_traces = []  # (variable, trace id) pairs bound to the selected element
+        self._pending_edits: Dict[str, Tuple[str, Callable]] = {}  # slot -> (after id, commit)
+        self._pdf_export_running = False  # a background PDF export is writing its file
+        self._panel_inputs: List[tk.Widget] = []  # cached widgets whose command targets the selection
+        self._spin_commits: Dict[tk.Widget, Callable] = {}  # spinbox -> its commit for the current selection
+
+        # Layer-sorted (type, index, layer) rows per page, keyed by id(page)
+        self._elem_order_cache: Dict[int, Tuple[PageData, List[Tuple[str, int, int]]]] = {}
+        self._elements_list_dirty = True  # element list rows need rebuilding on the next update
 
         # Initialize pages
         self._initialize_pages()
@@ -1197,67 +1352,90 @@ class BrochureGeneratorApp:
         style.theme_use('clam')
 
         # Colors
-        self.colors = {
-            'bg_dark': '#1a1a2e',
-            'bg_medium': '#16213e',
-            'bg_light': '#0f3460',
-            'accent': '#e94560',
-            'accent_hover': '#ff6b6b',
-            'text': '#eaeaea',
-            'text_dim': '#a0a0a0',
-            'success': '#4ade80',
-            'warning': '#fbbf24',
-        }
-
-        self.root.configure(bg=self.colors['bg_dark'])
+        self.colors = SimpleNamespace(
+            bg_dark='#1a1a2e',
+            bg_medium='#16213e',
+            bg_light='#0f3460',
+            accent='#e94560',
+            accent_hover='#ff6b6b',
+            text='#eaeaea',
+            text_dim='#a0a0a0',
+            success='#4ade80',
+            warning='#fbbf24',
+        )
+        c = self.colors
+
+        # Named Tk fonts and widget options shared by every button/field built in the UI
+        self._font_8 = tkfont.Font(self.root, family='Segoe UI', size=8)
+        self._font_9 = tkfont.Font(self.root, family='Segoe UI', size=9)
+        self._font_10 = tkfont.Font(self.root, family='Segoe UI', size=10)
+        self._font_10b = tkfont.Font(self.root, family='Segoe UI', size=10, weight='bold')
+        self._font_14b = tkfont.Font(self.root, family='Segoe UI', size=14, weight='bold')
+        self._dark_btn = dict(bg=c.bg_light, fg='white', cursor='hand2')
+        self._accent_btn = dict(bg=c.accent, fg='white', cursor='hand2')
+        self._field_cfg = dict(bg=c.bg_light, fg=c.text)
+        self._radio_cfg = dict(bg=c.bg_dark, fg=c.text, selectcolor=c.bg_light)
+        self._scale_cfg = dict(bg=c.bg_dark, fg=c.text, highlightthickness=0, troughcolor=c.bg_light)
+        self._dim_label_cfg = dict(bg=c.bg_medium, fg=c.text_dim)
+
+        self.root.configure(bg=self.colors.bg_dark)
 
         # Configure styles
-        style.configure('Dark.TFrame', background=self.colors['bg_dark'])
-        style.configure('Medium.TFrame', background=self.colors['bg_medium'])
-        style.configure('Light.TFrame', background=self.colors['bg_light'])
+        style.configure('Dark.TFrame', background=self.colors.bg_dark)
+        style.configure('Medium.TFrame', background=self.colors.bg_medium)
+        style.configure('Light.TFrame', background=self.colors.bg_light)
 
         style.configure('Dark.TLabel',
-                       background=self.colors['bg_dark'],
-                       foreground=self.colors['text'],
-                       font=('Segoe UI', 10))
+                       background=self.colors.bg_dark,
+                       foreground=self.colors.text,
+                       font=self._font_10)
 
         style.configure('Title.TLabel',
-                       background=self.colors['bg_dark'],
-                       foreground=self.colors['text'],
-                       font=('Segoe UI', 14, 'bold'))
+                       background=self.colors.bg_dark,
+                       foreground=self.colors.text,
+                       font=self._font_14b)
 
         style.configure('Accent.TButton',
-                       background=self.colors['accent'],
+                       background=self.colors.accent,
                        foreground='white',
-                       font=('Segoe UI', 10, 'bold'),
+                       font=self._font_10b,
                        padding=(10, 5))
 
         style.configure('Dark.TButton',
-                       background=self.colors['bg_light'],
-                       foreground=self.colors['text'],
-                       font=('Segoe UI', 10),
+                       background=self.colors.bg_light,
+                       foreground=self.colors.text,
+                       font=self._font_10,
                        padding=(10, 5))
 
         style.configure('Dark.TCombobox',
-                       background=self.colors['bg_light'],
-                       foreground=self.colors['text'],
-                       fieldbackground=self.colors['bg_light'])
+                       background=self.colors.bg_light,
+                       foreground=self.colors.text,
+                       fieldbackground=self.colors.bg_light)
 
         style.configure('Dark.TEntry',
-                       fieldbackground=self.colors['bg_light'],
-                       foreground=self.colors['text'])
+                       fieldbackground=self.colors.bg_light,
+                       foreground=self.colors.text)
 
         style.configure('Dark.TSpinbox',
-                       fieldbackground=self.colors['bg_light'],
-                       foreground=self.colors['text'])
+                       fieldbackground=self.colors.bg_light,
+                       foreground=self.colors.text)
 
-        style.configure("Dark.TNotebook", background=self.colors['bg_dark'])
+        style.configure("Dark.TNotebook", background=self.colors.bg_dark)
         style.configure("Dark.TNotebook.Tab",
-                       background=self.colors['bg_medium'],
-                       foreground=self.colors['text'],
+                       background=self.colors.bg_medium,
+                       foreground=self.colors.text,
                        padding=(10, 5))
         style.map("Dark.TNotebook.Tab",
-                 background=[('selected', self.colors['accent'])],
+                 background=[('selected', self.colors.accent)],
+                 foreground=[('selected', 'white')])
+
+        style.configure('Dark.Treeview',
+                       background=self.colors.bg_light,
+                       fieldbackground=self.colors.bg_light,
+                       foreground=self.colors.text,
+                       borderwidth=0)
+        style.map('Dark.Treeview',
+                 background=[('selected', self.colors.accent)],
                  foreground=[('selected', 'white')])
 
     def _create_ui(self):
@@ -1312,15 +1490,14 @@ class BrochureGeneratorApp:
         ttk.Label(export_frame, text="Export", style='Title.TLabel').pack(anchor=tk.W)
 
         export_btn = tk.Button(export_frame, text="📄 Export Print-Ready PDF",
-                              bg=self.colors['success'], fg='white',
-                              font=('Segoe UI', 10, 'bold'),
+                              bg=self.colors.success, fg='white',
+                              font=self._font_10b,
                               command=self._export_pdf, cursor='hand2')
         export_btn.pack(fill=tk.X, pady=5)
 
         export_img_btn = tk.Button(export_frame, text="🖼️ Export Pages as Images",
-                                   bg=self.colors['bg_light'], fg='white',
-                                   font=('Segoe UI', 10),
-                                   command=self._export_images, cursor='hand2')
+                                   font=self._font_10,
+                                   command=self._export_images, **self._dark_btn)
         export_img_btn.pack(fill=tk.X, pady=2)
 
     def _create_setup_tab(self, parent):
@@ -1335,10 +1512,9 @@ class BrochureGeneratorApp:
         for count in [1, 2, 4, 8]:
             rb = tk.Radiobutton(page_frame, text=f"{count} page{'s' if count > 1 else ''}",
                                variable=self.page_count_var, value=count,
-                               bg=self.colors['bg_dark'], fg=self.colors['text'],
-                               selectcolor=self.colors['bg_light'],
-                               activebackground=self.colors['bg_dark'],
-                               activeforeground=self.colors['accent'],
+                               **self._radio_cfg,
+                               activebackground=self.colors.bg_dark,
+                               activeforeground=self.colors.accent,
                                command=self._on_page_count_change)
             rb.pack(anchor=tk.W)
 
@@ -1365,8 +1541,8 @@ A5 booklet with pages in order.
 1 page = Half A4"""
 
         info_label = tk.Label(info_frame, text=info_text,
-                             bg=self.colors['bg_medium'], fg=self.colors['text_dim'],
-                             font=('Segoe UI', 9), justify=tk.LEFT, padx=10, pady=10)
+                             **self._dim_label_cfg,
+                             font=self._font_9, justify=tk.LEFT, padx=10, pady=10)
         info_label.pack(fill=tk.X)
 
     def _create_templates_tab(self, parent):
@@ -1374,7 +1550,7 @@ A5 booklet with pages in order.
         ttk.Label(parent, text="Select Template:", style='Dark.TLabel').pack(anchor=tk.W, pady=(10, 5), padx=10)
 
         # Scrollable template list
-        canvas = tk.Canvas(parent, bg=self.colors['bg_dark'], highlightthickness=0)
+        canvas = tk.Canvas(parent, bg=self.colors.bg_dark, highlightthickness=0)
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas, style='Dark.TFrame')
 
@@ -1395,15 +1571,14 @@ A5 booklet with pages in order.
             btn_frame.pack(fill=tk.X, pady=3)
 
             btn = tk.Button(btn_frame, text=template.name,
-                           bg=self.colors['bg_light'], fg='white',
-                           font=('Segoe UI', 10, 'bold'),
-                           anchor='w', padx=10, cursor='hand2',
-                           command=lambda k=key: self._apply_template(k))
+                           font=self._font_10b,
+                           anchor='w', padx=10,
+                           command=functools.partial(self._apply_template, key), **self._dark_btn)
             btn.pack(fill=tk.X)
 
             desc = tk.Label(btn_frame, text=template.description,
-                           bg=self.colors['bg_medium'], fg=self.colors['text_dim'],
-                           font=('Segoe UI', 8), anchor='w', padx=10, wraplength=230)
+                           **self._dim_label_cfg,
+                           font=self._font_8, anchor='w', padx=10, wraplength=230)
             desc.pack(fill=tk.X)
 
     def _create_elements_tab(self, parent):
@@ -1412,16 +1587,14 @@ A5 booklet with pages in order.
 
         # Add text button
         add_text_btn = tk.Button(parent, text="[T] Add Text",
-                                bg=self.colors['bg_light'], fg='white',
-                                font=('Segoe UI', 10),
-                                command=self._add_text_element, cursor='hand2')
+                                font=self._font_10,
+                                command=self._add_text_element, **self._dark_btn)
         add_text_btn.pack(fill=tk.X, padx=10, pady=3)
 
         # Add image button
         add_img_btn = tk.Button(parent, text="[+] Import Image",
-                               bg=self.colors['accent'], fg='white',
-                               font=('Segoe UI', 10, 'bold'),
-                               command=self._import_image, cursor='hand2')
+                               font=self._font_10b,
+                               command=self._import_image, **self._accent_btn)
         add_img_btn.pack(fill=tk.X, padx=10, pady=3)
 
         # Add shape buttons
@@ -1430,18 +1603,16 @@ A5 booklet with pages in order.
 
         for shape, label in [("rectangle", "[=] Rectangle"), ("circle", "[O] Circle"), ("triangle", "[^] Triangle")]:
             btn = tk.Button(shapes_frame, text=label,
-                           bg=self.colors['bg_light'], fg='white',
-                           font=('Segoe UI', 9),
-                           command=lambda s=shape: self._add_shape_element(s), cursor='hand2')
+                           font=self._font_9,
+                           command=functools.partial(self._add_shape_element, shape), **self._dark_btn)
             btn.pack(fill=tk.X, pady=2)
 
         # Page background
         ttk.Label(parent, text="\nPage Background:", style='Dark.TLabel').pack(anchor=tk.W, padx=10)
 
         bg_color_btn = tk.Button(parent, text="🎨 Background Color",
-                                bg=self.colors['bg_light'], fg='white',
-                                font=('Segoe UI', 10),
-                                command=self._change_bg_color, cursor='hand2')
+                                font=self._font_10,
+                                command=self._change_bg_color, **self._dark_btn)
         bg_color_btn.pack(fill=tk.X, padx=10, pady=3)
 
         # Gradient options
@@ -1450,14 +1621,20 @@ A5 booklet with pages in order.
         grad_frame = ttk.Frame(parent, style='Dark.TFrame')
         grad_frame.pack(fill=tk.X, padx=10)
 
-        self.grad_color1_btn = tk.Button(grad_frame, text="Color 1", width=10,
-                                        bg='#3498db', fg='white',
-                                        command=lambda: self._change_grad_color(1), cursor='hand2')
+        # Each button shows its colour as a swatch image, recoloured in place while picking
+        self._grad_colors = ['#3498db', '#9b59b6']
+        self._grad_swatches = [tk.PhotoImage(master=self.root, width=20, height=20) for _ in range(2)]
+        for swatch, color in zip(self._grad_swatches, self._grad_colors):
+            swatch.put(color, to=(0, 0, 20, 20))
+
+        self.grad_color1_btn = tk.Button(grad_frame, text="Color 1", image=self._grad_swatches[0],
+                                        compound=tk.LEFT, padx=6,
+                                        command=functools.partial(self._change_grad_color, 1), **self._dark_btn)
         self.grad_color1_btn.pack(side=tk.LEFT, padx=2)
 
-        self.grad_color2_btn = tk.Button(grad_frame, text="Color 2", width=10,
-                                        bg='#9b59b6', fg='white',
-                                        command=lambda: self._change_grad_color(2), cursor='hand2')
+        self.grad_color2_btn = tk.Button(grad_frame, text="Color 2", image=self._grad_swatches[1],
+                                        compound=tk.LEFT, padx=6,
+                                        command=functools.partial(self._change_grad_color, 2), **self._dark_btn)
         self.grad_color2_btn.pack(side=tk.LEFT, padx=2)
 
         self.grad_dir_var = tk.StringVar(value="vertical")
@@ -1465,16 +1642,14 @@ A5 booklet with pages in order.
                                      values=["vertical", "horizontal", "diagonal"],
                                      state="readonly", width=15)
         grad_dir_combo.pack(padx=10, pady=5)
-        grad_dir_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_gradient())
+        grad_dir_combo.bind("<<ComboboxSelected>>", self._apply_gradient)
 
         apply_grad_btn = tk.Button(parent, text="Apply Gradient",
-                                  bg=self.colors['accent'], fg='white',
-                                  command=self._apply_gradient, cursor='hand2')
+                                  command=self._apply_gradient, **self._accent_btn)
         apply_grad_btn.pack(fill=tk.X, padx=10, pady=3)
 
         clear_grad_btn = tk.Button(parent, text="Clear Gradient",
-                                  bg=self.colors['bg_light'], fg='white',
-                                  command=self._clear_gradient, cursor='hand2')
+                                  command=self._clear_gradient, **self._dark_btn)
         clear_grad_btn.pack(fill=tk.X, padx=10, pady=3)
 
     def _create_preview_area(self, parent):
@@ -1493,9 +1668,8 @@ A5 booklet with pages in order.
 
         for text, value in modes:
             rb = tk.Radiobutton(mode_frame, text=text, variable=self.preview_mode_var,
-                               value=value, bg=self.colors['bg_dark'], fg=self.colors['text'],
-                               selectcolor=self.colors['bg_light'],
-                               activebackground=self.colors['bg_dark'],
+                               value=value, **self._radio_cfg,
+                               activebackground=self.colors.bg_dark,
                                command=self._on_preview_mode_change)
             rb.pack(side=tk.LEFT, padx=10)
 
@@ -1504,29 +1678,29 @@ A5 booklet with pages in order.
         nav_frame.pack(fill=tk.X, pady=5)
 
         self.prev_btn = tk.Button(nav_frame, text="◀ Previous",
-                                 bg=self.colors['bg_light'], fg='white',
-                                 command=self._prev_page, cursor='hand2')
+                                 command=self._prev_page, **self._dark_btn)
         self.prev_btn.pack(side=tk.LEFT, padx=10)
 
         self.page_label = ttk.Label(nav_frame, text="Page 1 of 4", style='Dark.TLabel')
         self.page_label.pack(side=tk.LEFT, expand=True)
 
         self.next_btn = tk.Button(nav_frame, text="Next ▶",
-                                 bg=self.colors['bg_light'], fg='white',
-                                 command=self._next_page, cursor='hand2')
+                                 command=self._next_page, **self._dark_btn)
         self.next_btn.pack(side=tk.RIGHT, padx=10)
 
         # Canvas for preview
         self.preview_canvas = tk.Canvas(preview_container,
-                                        bg=self.colors['bg_medium'],
+                                        bg=self.colors.bg_medium,
                                         highlightthickness=1,
-                                        highlightbackground=self.colors['bg_light'])
+                                        highlightbackground=self.colors.bg_light)
         self.preview_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Bind canvas events
         self.preview_canvas.bind('<Configure>', self._on_canvas_resize)
-        self.preview_canvas.bind('<Button-1>', self._on_canvas_click)
-        self.preview_canvas.bind('<B1-Motion>', self._on_canvas_drag)
+        # Redraws are skipped while the window is minimized; catch up when it is restored
+        self.root.bind('<Map>', self._on_window_map, add='+')
+        self._edit_bindings: Dict[str, str] = {}  # sequence -> funcid, bound in single mode only
+        self._bind_edit_handlers()
 
         # Current page info label
         self.info_label = ttk.Label(preview_container, text="", style='Dark.TLabel')
@@ -1556,98 +1730,127 @@ A5 booklet with pages in order.
 
         self.elements_header_label = tk.Label(self.elements_header_frame,
                                                text="Page Elements for ",
-                                               bg=self.colors['bg_dark'],
-                                               fg=self.colors['text'],
-                                               font=('Segoe UI', 10))
+                                               bg=self.colors.bg_dark,
+                                               fg=self.colors.text,
+                                               font=self._font_10)
         self.elements_header_label.pack(side=tk.LEFT)
 
         self.page_number_label = tk.Label(self.elements_header_frame,
                                            text=f"Page {self.current_page_index + 1}",
-                                           bg=self.colors['bg_dark'],
-                                           fg=self.colors['accent'],
-                                           font=('Segoe UI', 10, 'bold'))
+                                           bg=self.colors.bg_dark,
+                                           fg=self.colors.accent,
+                                           font=self._font_10b)
         self.page_number_label.pack(side=tk.LEFT)
 
-        self.elements_listbox = tk.Listbox(sidebar, bg=self.colors['bg_light'],
-                                           fg=self.colors['text'],
-                                           selectbackground=self.colors['accent'],
-                                           height=8)
-        self.elements_listbox.pack(fill=tk.X, padx=10, pady=5)
-        self.elements_listbox.bind('<<ListboxSelect>>', self._on_element_select)
+        # Row iids are positions in _get_sorted_elements(), so one row can be relabelled in place
+        self.elements_tree = ttk.Treeview(sidebar, columns=('label',), show='', height=8,
+                                          selectmode='browse', style='Dark.Treeview')
+        self.elements_tree.pack(fill=tk.X, padx=10, pady=5)
+        self.elements_tree.bind('<<TreeviewSelect>>', self._on_element_select)
 
         # Delete button
         delete_btn = tk.Button(sidebar, text="🗑️ Delete Selected",
-                              bg=self.colors['accent'], fg='white',
-                              command=self._delete_selected_element, cursor='hand2')
+                              command=self._delete_selected_element, **self._accent_btn)
         delete_btn.pack(fill=tk.X, padx=10, pady=5)
 
     def _on_page_count_change(self):
         """Handle page count change"""
-        new_count = self.page_count_var.get()
-        self.brochure.page_count = new_count
-
-        # Adjust pages list
-        while len(self.brochure.pages) < new_count:
-            self.brochure.pages.append(PageData())
-        while len(self.brochure.pages) > new_count:
-            self.brochure.pages.pop()
-
-        # Reset to first page
-        self.current_page_index = 0
-        self._update_preview()
-        self._update_page_label()
-        self._update_elements_list()
+        with self._batch_updates():
+            new_count = self.page_count_var.get()
+            self.brochure.page_count = new_count
+
+            # Adjust pages list in one step each way
+            pages = self.brochure.pages
+            pages.extend(PageData() for _ in range(new_count - len(pages)))
+            del pages[new_count:]
+            self._invalidate_element_order()
+
+            # Reset to first page; the preview is rebuilt from the event loop so the
+            # radio button repaints before the (comparatively slow) render
+            self.current_page_index = 0
+            self._request_preview_update()
+            self._update_page_label()
+            self._update_elements_list()
 
     def _on_preview_mode_change(self):
         """Handle preview mode change"""
         self.preview_mode = self.preview_mode_var.get()
+        # Spread and print views aren't editable, so don't route mouse events through Python
+        if self.preview_mode == "single":
+            self._bind_edit_handlers()
+        else:
+            self._unbind_edit_handlers()
         self._update_preview()
         self._update_page_label()
 
+    def _bind_edit_handlers(self):
+        """Bind the click/drag editing handlers to the preview canvas"""
+        if self._edit_bindings:
+            return
+        for sequence, handler in (('<Button-1>', self._on_canvas_click),
+                                  ('<B1-Motion>', self._on_canvas_drag)):
+            self._edit_bindings[sequence] = self.preview_canvas.bind(sequence, handler, add='+')
+
+    def _unbind_edit_handlers(self):
+        """Remove only the editing handlers bound by _bind_edit_handlers"""
+        for sequence, funcid in self._edit_bindings.items():
+            self.preview_canvas.unbind(sequence, funcid)
+        self._edit_bindings = {}
+
     def _apply_template(self, template_key: str):
         """Apply a template to the brochure"""
-        if template_key == "blank":
-            # Reset to blank
-            self._initialize_pages()
-        else:
-            template = TEMPLATES[template_key]
-            self.brochure = template.apply(self.brochure)
+        with self._batch_updates():
+            if template_key == "blank":
+                # Reset to blank
+                self._initialize_pages()
+            else:
+                template = TEMPLATES[template_key]
+                self.brochure = template.apply(self.brochure)
 
-        self._update_preview()
-        self._update_elements_list()
+            # Templates rewrite pages in place
+            self._invalidate_element_order()
+            self._bump()
+            self._update_preview()
+            self._update_elements_list()
 
     def _add_text_element(self):
         """Add a new text element to the current page"""
-        page = self.brochure.pages[self.current_page_index]
+        with self._batch_updates():
+            page = self.brochure.pages[self.current_page_index]
 
-        new_text = TextElement(
-            text="New Text",
-            x=50, y=50,
-            font_family="Arial",
-            font_size=24,
-            font_color="#000000"
-        )
-        page.text_elements.append(new_text)
+            new_text = TextElement(
+                text="New Text",
+                x=50, y=50,
+                font_family="Arial",
+                font_size=24,
+                font_color="#000000"
+            )
+            page.text_elements.append(new_text)
+            self._invalidate_element_order(page)
+            self._bump(page)
 
-        self._update_preview()
-        self._update_elements_list()
+            self._update_preview()
+            self._update_elements_list()
 
     def _add_shape_element(self, shape_type: str):
         """Add a new shape element to the current page"""
-        page = self.brochure.pages[self.current_page_index]
+        with self._batch_updates():
+            page = self.brochure.pages[self.current_page_index]
 
-        new_shape = ShapeElement(
-            shape_type=shape_type,
-            x=50, y=50,
-            width=20, height=20,
-            fill_color="#3498db",
-            stroke_color="#2980b9",
-            stroke_width=2
-        )
-        page.shape_elements.append(new_shape)
+            new_shape = ShapeElement(
+                shape_type=shape_type,
+                x=50, y=50,
+                width=20, height=20,
+                fill_color="#3498db",
+                stroke_color="#2980b9",
+                stroke_width=2
+            )
+            page.shape_elements.append(new_shape)
+            self._invalidate_element_order(page)
+            self._bump(page)
 
-        self._update_preview()
-        self._update_elements_list()
+            self._update_preview()
+            self._update_elements_list()
 
     def _change_bg_color(self):
         """Change the background color of the current page with real-time preview"""
@@ -1658,7 +1861,7 @@ A5 booklet with pages in order.
         def on_color_change(color):
             page.background_color = color
             page.background_gradient = None
-            self._update_preview()
+            self._request_preview_update(page)
 
         picker = RealTimeColorPicker(self.root, original_color, on_color_change, "Background Color")
         result = picker.get_color()
@@ -1667,67 +1870,91 @@ A5 booklet with pages in order.
             # User cancelled - revert to original
             page.background_color = original_color
             page.background_gradient = original_gradient
+            self._bump(page)
             self._update_preview()
 
     def _change_grad_color(self, which: int):
         """Change gradient color with real-time preview"""
-        current = self.grad_color1_btn.cget('bg') if which == 1 else self.grad_color2_btn.cget('bg')
+        current = self._grad_colors[which - 1]
         page = self.brochure.pages[self.current_page_index]
 
         def on_color_change(color):
-            if which == 1:
-                self.grad_color1_btn.configure(bg=color)
-            else:
-                self.grad_color2_btn.configure(bg=color)
+            self._grad_colors[which - 1] = color
+            self._grad_swatches[which - 1].put(color, to=(0, 0, 20, 20))
             # Apply gradient preview
-            color1 = self.grad_color1_btn.cget('bg')
-            color2 = self.grad_color2_btn.cget('bg')
+            color1, color2 = self._grad_colors
             direction = self.grad_dir_var.get()
             page.background_gradient = (color1, color2, direction)
-            self._update_preview()
+            self._request_preview_update(page)
 
         picker = RealTimeColorPicker(self.root, current, on_color_change, f"Gradient Color {which}")
         picker.get_color()
 
-    def _apply_gradient(self):
+    def _apply_gradient(self, event=None):
         """Apply gradient to current page"""
         page = self.brochure.pages[self.current_page_index]
-        color1 = self.grad_color1_btn.cget('bg')
-        color2 = self.grad_color2_btn.cget('bg')
+        color1, color2 = self._grad_colors
         direction = self.grad_dir_var.get()
 
         page.background_gradient = (color1, color2, direction)
+        self._bump(page)
         self._update_preview()
 
     def _clear_gradient(self):
         """Clear gradient from current page"""
         page = self.brochure.pages[self.current_page_index]
         page.background_gradient = None
+        self._bump(page)
         self._update_preview()
 
     def _prev_page(self):
         """Navigate to previous page"""
-        if self.current_page_index > 0:
-            self.current_page_index -= 1
-            self._update_preview()
-            self._update_page_label()
-            self._update_elements_list()
+        with self._batch_updates():
+            if self.current_page_index > 0:
+                self.current_page_index -= 1
+                self._elements_list_dirty = True
+                self._update_preview()
+                self._update_page_label()
+                self._update_elements_list()
 
     def _next_page(self):
         """Navigate to next page"""
-        if self.current_page_index < self.brochure.page_count - 1:
-            self.current_page_index += 1
-            self._update_preview()
-            self._update_page_label()
-            self._update_elements_list()
+        with self._batch_updates():
+            if self.current_page_index < self.brochure.page_count - 1:
+                self.current_page_index += 1
+                self._elements_list_dirty = True
+                self._update_preview()
+                self._update_page_label()
+                self._update_elements_list()
+
+    @contextmanager
+    def _batch_updates(self):
+        """Defer preview/list/label refreshes until the outermost batch exits, then run each once"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                dirty, self._batch_dirty = self._batch_dirty, set()
+                if 'preview' in dirty:
+                    self._update_preview()
+                if 'page_label' in dirty:
+                    self._update_page_label()
+                if 'elements' in dirty:
+                    self._update_elements_list()
 
     def _update_page_label(self):
         """Update the page navigation label"""
+        if self._batch_depth:
+            self._batch_dirty.add('page_label')
+            return
+
         if self.preview_mode == "single":
             self.page_label.configure(
                 text=f"Page {self.current_page_index + 1} of {self.brochure.page_count}")
         elif self.preview_mode == "spread":
-            spreads = BookletImposition.get_spread_pairs(self.brochure.page_count)
+            spreads = self._get_spread_pairs()
             spread_idx = self.current_page_index // 2
             if spread_idx < len(spreads):
                 self.page_label.configure(text=spreads[spread_idx][2])
@@ -1736,340 +1963,541 @@ A5 booklet with pages in order.
         else:  # print
             self.page_label.configure(text="Print Layout (A4 sheets)")
 
+    def _get_spread_pairs(self) -> List[Tuple[int, int, str]]:
+        """Get the spread pairs for the current page count, recomputed only when it changes"""
+        if self._spread_pairs_for != self.brochure.page_count:
+            self._spread_pairs = BookletImposition.get_spread_pairs(self.brochure.page_count)
+            self._spread_pairs_for = self.brochure.page_count
+        return self._spread_pairs
+
     def _update_elements_list(self):
-        """Update the elements listbox"""
-        self.elements_listbox.delete(0, tk.END)
+        """Update the elements list"""
+        if self._batch_depth:
+            self._batch_dirty.add('elements')
+            return
 
         # Update page number label
         self.page_number_label.configure(text=f"Page {self.current_page_index + 1}")
 
-        page = self.brochure.pages[self.current_page_index]
-
-        # Collect all elements with layer info for display
-        elements_display = []
-
-        for i, shape in enumerate(page.shape_elements):
-            layer = getattr(shape, 'layer_index', 0)
-            elements_display.append(('shape', i, f"[L{layer}] {shape.shape_type.title()} {i+1}", layer))
+        # Rows only change when elements are added, removed, re-layered or the page changes
+        if not self._elements_list_dirty:
+            return
+        self._elements_list_dirty = False
 
-        for i, img in enumerate(page.image_elements):
-            layer = getattr(img, 'layer_index', 0)
+        tree = self.elements_tree
+        page = self.brochure.pages[self.current_page_index]
+        label = self._element_label
+
+        # Rows come pre-sorted by layer; only the labels are built here
+        labels = [label(page, elem_type, i, layer) for elem_type, i, layer in self._get_sorted_elements(page)]
+
+        # Rows may now show other elements, so drop the selection as a full rebuild would
+        selection = tree.selection()
+        if selection:
+            tree.selection_remove(*selection)
+
+        # Row iids are positions, so diff by position: rewrite changed labels, then add or trim the tail
+        old_count = len(tree.get_children())
+        for row, text in enumerate(labels[:old_count]):
+            if tree.set(str(row), 'label') != text:
+                tree.set(str(row), 'label', text)
+        if old_count > len(labels):
+            tree.delete(*[str(row) for row in range(len(labels), old_count)])
+        for row in range(old_count, len(labels)):
+            tree.insert('', 'end', iid=str(row), values=(labels[row],))
+
+    def _element_label(self, page: PageData, elem_type: str, i: int, layer: int) -> str:
+        """Build the elements list label for one element"""
+        if elem_type == 'shape':
+            shape = page.shape_elements[i]
+            return f"[L{layer}] {shape.shape_type.title()} {i+1}"
+        elif elem_type == 'image':
+            img = page.image_elements[i]
             name = os.path.basename(img.image_path) if img.image_path else f"Image {i+1}"
             name = name[:15] + "..." if len(name) > 15 else name
-            elements_display.append(('image', i, f"[L{layer}] IMG: {name}", layer))
-
-        for i, text in enumerate(page.text_elements):
-            layer = getattr(text, 'layer_index', 0)
+            return f"[L{layer}] IMG: {name}"
+        else:
+            text = page.text_elements[i]
             preview = text.text[:15] + "..." if len(text.text) > 15 else text.text
             preview = preview.replace('\n', ' ')
-            elements_display.append(('text', i, f"[L{layer}] TXT: {preview}", layer))
+            return f"[L{layer}] TXT: {preview}"
 
-        # Sort by layer for display
-        elements_display.sort(key=lambda x: x[3])
+    def _refresh_element_label(self, elem):
+        """Rewrite one elements list row in place after an edit that changes only its label"""
+        if self._elements_list_dirty:
+            return  # A full rebuild is already due
 
-        for elem_type, idx, display_text, _ in elements_display:
-            self.elements_listbox.insert(tk.END, display_text)
+        page = self.brochure.pages[self.current_page_index]
+        lists = {'shape': page.shape_elements, 'image': page.image_elements, 'text': page.text_elements}
+        for row, (elem_type, i, layer) in enumerate(self._get_sorted_elements(page)):
+            if lists[elem_type][i] is elem:
+                self.elements_tree.set(str(row), 'label', self._element_label(page, elem_type, i, layer))
+                return
+
+    def _get_sorted_elements(self, page: PageData) -> List[Tuple[str, int, int]]:
+        """Get (type, index, layer) rows for a page in list order, cached until invalidated"""
+        cached = self._elem_order_cache.get(id(page))
+        if cached is not None and cached[0] is page:
+            return cached[1]
+
+        rows = [('shape', i, e.layer_index) for i, e in enumerate(page.shape_elements)]
+        rows += [('image', i, e.layer_index) for i, e in enumerate(page.image_elements)]
+        rows += [('text', i, e.layer_index) for i, e in enumerate(page.text_elements)]
+        rows.sort(key=itemgetter(2))
+
+        # Keep the page itself so a recycled id() can't return another page's rows
+        self._elem_order_cache[id(page)] = (page, rows)
+        return rows
+
+    def _invalidate_element_order(self, page: Optional[PageData] = None):
+        """Drop the cached element order for one page, or for every page"""
+        if page is None:
+            self._elem_order_cache.clear()
+        else:
+            self._elem_order_cache.pop(id(page), None)
+        self._elements_list_dirty = True
 
     def _on_element_select(self, event):
-        """Handle element selection from listbox"""
-        selection = self.elements_listbox.curselection()
-        if not selection:
-            return
+        """Handle element selection from the elements list"""
+        with self._batch_updates():
+            selection = self.elements_tree.selection()
+            if not selection:
+                return
 
-        idx = selection[0]
-        page = self.brochure.pages[self.current_page_index]
+            idx = int(selection[0])
+            page = self.brochure.pages[self.current_page_index]
 
-        # Rebuild elements_display to find which element was selected
-        elements_display = []
+            # Same order as displayed
+            elements_display = self._get_sorted_elements(page)
 
-        for i, shape in enumerate(page.shape_elements):
-            layer = getattr(shape, 'layer_index', 0)
-            elements_display.append(('shape', i, layer))
+            if idx < len(elements_display):
+                elem_type, elem_idx, _ = elements_display[idx]
+                self.selected_element = (elem_type, elem_idx)
 
-        for i, img in enumerate(page.image_elements):
-            layer = getattr(img, 'layer_index', 0)
-            elements_display.append(('image', i, layer))
+                if elem_type == 'shape':
+                    self._show_shape_properties(page.shape_elements[elem_idx])
+                elif elem_type == 'image':
+                    self._show_image_properties(page.image_elements[elem_idx])
+                elif elem_type == 'text':
+                    self._show_text_properties(page.text_elements[elem_idx])
 
-        for i, text in enumerate(page.text_elements):
-            layer = getattr(text, 'layer_index', 0)
-            elements_display.append(('text', i, layer))
+            self._update_preview()
 
-        # Sort by layer (same order as displayed)
-        elements_display.sort(key=lambda x: x[2])
+    def _clear_properties_panel(self):
+        """Hide the cached property panels, detach their traces and destroy one-off widgets"""
+        # Apply edits still waiting on their debounce, or typed into a spinbox that still has
+        # focus (buttons don't take focus), while the widgets hold the old element
+        self._flush_pending_edits()
+        self._commit_focused_spin()
+        self._spin_commits.clear()
+
+        for var, trace_id in self._active_traces:
+            var.trace_remove('write', trace_id)
+        self._active_traces = []
+        # Loading the next element's values must not fire the previous element's command
+        for widget in self._panel_inputs:
+            widget.configure(command='')
+
+        cached = list(self._props_panels.values()) + [self.no_selection_label]
+        for widget in self.properties_frame.winfo_children():
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
-        if idx < len(elements_display):
-            elem_type, elem_idx, _ = elements_display[idx]
-            self.selected_element = (elem_type, elem_idx)
+    def _trace_var(self, var: tk.Variable, callback):
+        """Attach a write trace that is removed again by _clear_properties_panel"""
+        self._active_traces.append((var, var.trace_add('write', callback)))
 
-            if elem_type == 'shape':
-                self._show_shape_properties(page.shape_elements[elem_idx])
-            elif elem_type == 'image':
-                self._show_image_properties(page.image_elements[elem_idx])
-            elif elem_type == 'text':
-                self._show_text_properties(page.text_elements[elem_idx])
+    def _debounce_edit(self, slot: str, commit: Callable):
+        """Run commit once input in the given slot has been quiet for EDIT_DEBOUNCE_MS"""
+        pending = self._pending_edits.pop(slot, None)
+        if pending is not None:
+            self.root.after_cancel(pending[0])
 
-        self._update_preview()
+        def run():
+            self._pending_edits.pop(slot, None)
+            commit()
 
-    def _show_text_properties(self, text_elem: TextElement):
-        """Show text element properties in the right sidebar"""
-        # Clear existing properties
-        for widget in self.properties_frame.winfo_children():
-            widget.destroy()
+        self._pending_edits[slot] = (self.root.after(EDIT_DEBOUNCE_MS, run), commit)
 
-        # Text content
-        ttk.Label(self.properties_frame, text="Text:", style='Dark.TLabel').pack(anchor=tk.W, pady=(0, 5))
+    def _on_slider_change(self, slot: str, commit: Callable):
+        """Apply a slider value live while it is dragged, debounced otherwise (keyboard, trough clicks)"""
+        if self._dragging:
+            commit()
+        else:
+            self._debounce_edit(slot, commit)
+
+    def _bind_drag_preview(self, scale: tk.Scale):
+        """Render low-resolution previews while the slider is held, and a full one on release"""
+        scale.bind('<ButtonPress-1>', self._begin_drag, add='+')
+        scale.bind('<ButtonRelease-1>', self._end_drag, add='+')
+
+    def _begin_drag(self, event=None):
+        """Enter low-resolution preview mode for a slider drag"""
+        self._dragging = True
+
+    def _end_drag(self, event=None):
+        """Leave drag mode and queue a full-resolution redraw"""
+        self._dragging = False
+        self._flush_pending_edits()
+        self._request_preview_update()
+
+    def _flush_pending_edits(self):
+        """Apply every debounced edit immediately"""
+        pending, self._pending_edits = self._pending_edits, {}
+        for after_id, commit in pending.values():
+            self.root.after_cancel(after_id)
+            commit()
+
+    def _bind_spin_commit(self, spin: tk.Spinbox, commit: Callable):
+        """Apply a spinbox value on arrow clicks, Return or focus loss rather than per keystroke"""
+        def run(*args):
+            try:
+                commit()
+            except (tk.TclError, ValueError):
+                pass  # Partially typed value (e.g. empty or "-"), wait for a valid one
 
-        text_entry = tk.Text(self.properties_frame, height=4, width=25,
-                            bg=self.colors['bg_light'], fg=self.colors['text'],
-                            insertbackground=self.colors['text'])
-        text_entry.insert('1.0', text_elem.text)
-        text_entry.pack(fill=tk.X, pady=(0, 10))
+        spin.configure(command=run)
+        spin.bind('<Return>', run)
+        spin.bind('<FocusOut>', run)
+        self._spin_commits[spin] = run
 
-        def update_text(*args):
-            text_elem.text = text_entry.get('1.0', 'end-1c')
-            self._update_preview()
+    def _commit_focused_spin(self):
+        """Apply a value typed into the focused spinbox that hasn't been committed yet"""
+        try:
+            focused = self.root.focus_get()
+        except KeyError:
+            return  # Focus is in a Tk-internal widget (e.g. a combobox popdown), not a spinbox
+        run = self._spin_commits.get(focused)
+        if run is not None:
+            run()
+
+    def _get_props_panel(self, kind: str) -> ttk.Frame:
+        """Get the cached properties panel for an element kind, building it on first use"""
+        panel = self._props_panels.get(kind)
+        if panel is None:
+            panel = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+            builders = {'text': self._build_text_props_panel, 'shape': self._build_shape_props_panel,
+                        'image': self._build_image_props_panel}
+            builders[kind](panel)
+            self._props_panels[kind] = panel
+        return panel
+
+    def _build_text_props_panel(self, panel: ttk.Frame):
+        """Create the text properties widgets once; values are loaded per selection"""
+        v = self._text_vars = {
+            'size': tk.IntVar(),
+            'x': tk.IntVar(),
+            'y': tk.IntVar(),
+            'align': tk.StringVar(),
+            'rotation': tk.DoubleVar(),
+            'layer': tk.IntVar(),
+        }
 
-        text_entry.bind('<KeyRelease>', update_text)
+        # Text content
+        ttk.Label(panel, text="Text:", style='Dark.TLabel').pack(anchor=tk.W, pady=(0, 5))
+
+        self._text_entry = tk.Text(panel, height=4, width=25,
+                                   bg=self.colors.bg_light, fg=self.colors.text,
+                                   insertbackground=self.colors.text)
+        self._text_entry.pack(fill=tk.X, pady=(0, 10))
 
         # Font size
-        ttk.Label(self.properties_frame, text="Font Size:", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Font Size:", style='Dark.TLabel').pack(anchor=tk.W)
 
-        size_var = tk.IntVar(value=text_elem.font_size)
-        size_spin = tk.Spinbox(self.properties_frame, from_=8, to=72, textvariable=size_var,
-                              width=10, bg=self.colors['bg_light'], fg=self.colors['text'])
+        size_spin = tk.Spinbox(panel, from_=8, to=72, textvariable=v['size'],
+                              width=10, **self._field_cfg)
         size_spin.pack(anchor=tk.W, pady=(0, 10))
 
-        def update_size(*args):
-            text_elem.font_size = size_var.get()
-            self._update_preview()
-
-        size_var.trace('w', update_size)
-
         # Color with real-time preview
-        ttk.Label(self.properties_frame, text="Color:", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Color:", style='Dark.TLabel').pack(anchor=tk.W)
 
-        color_btn = tk.Button(self.properties_frame, text="Choose Color",
-                             bg=text_elem.font_color, fg='white',
-                             cursor='hand2')
-        color_btn.pack(anchor=tk.W, pady=(0, 10))
-
-        def change_color():
-            def on_color_change(color):
-                text_elem.font_color = color
-                color_btn.configure(bg=color)
-                self._update_preview()
-
-            picker = RealTimeColorPicker(self.root, text_elem.font_color, on_color_change, "Text Color")
-            picker.get_color()
-
-        color_btn.configure(command=change_color)
+        self._text_color_btn = tk.Button(panel, text="Choose Color", fg='white', cursor='hand2')
+        self._text_color_btn.pack(anchor=tk.W, pady=(0, 10))
 
         # Position
-        ttk.Label(self.properties_frame, text="Position (%):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Position (%):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        pos_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        pos_frame = ttk.Frame(panel, style='Dark.TFrame')
         pos_frame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Label(pos_frame, text="X:", style='Dark.TLabel').pack(side=tk.LEFT)
-        x_var = tk.IntVar(value=int(text_elem.x))
-        x_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=x_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        x_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=v['x'], width=5,
+                           **self._field_cfg)
         x_spin.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(pos_frame, text="Y:", style='Dark.TLabel').pack(side=tk.LEFT)
-        y_var = tk.IntVar(value=int(text_elem.y))
-        y_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=y_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        y_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=v['y'], width=5,
+                           **self._field_cfg)
         y_spin.pack(side=tk.LEFT, padx=5)
 
-        def update_pos(*args):
-            text_elem.x = x_var.get()
-            text_elem.y = y_var.get()
-            self._update_preview()
-
-        x_var.trace('w', update_pos)
-        y_var.trace('w', update_pos)
-
         # Alignment
-        ttk.Label(self.properties_frame, text="Alignment:", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Alignment:", style='Dark.TLabel').pack(anchor=tk.W)
 
-        align_var = tk.StringVar(value=text_elem.alignment)
-        align_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        align_frame = ttk.Frame(panel, style='Dark.TFrame')
         align_frame.pack(fill=tk.X, pady=(0, 10))
 
         for align in ["left", "center", "right"]:
-            rb = tk.Radiobutton(align_frame, text=align.title(), variable=align_var,
-                               value=align, bg=self.colors['bg_dark'], fg=self.colors['text'],
-                               selectcolor=self.colors['bg_light'])
+            rb = tk.Radiobutton(align_frame, text=align.title(), variable=v['align'],
+                               value=align, **self._radio_cfg)
             rb.pack(side=tk.LEFT)
 
-        def update_align(*args):
-            text_elem.alignment = align_var.get()
-            self._update_preview()
-
-        align_var.trace('w', update_align)
-
         # Rotation
-        ttk.Label(self.properties_frame, text="Rotation (degrees):", style='Dark.TLabel').pack(anchor=tk.W)
-
-        rotation_var = tk.DoubleVar(value=getattr(text_elem, 'rotation', 0))
-        rotation_scale = tk.Scale(self.properties_frame, from_=0, to=360, resolution=1,
-                                 orient=tk.HORIZONTAL, variable=rotation_var,
-                                 bg=self.colors['bg_dark'], fg=self.colors['text'],
-                                 highlightthickness=0, troughcolor=self.colors['bg_light'])
-        rotation_scale.pack(fill=tk.X, pady=(0, 10))
-
-        def update_rotation(*args):
-            text_elem.rotation = rotation_var.get()
-            self._update_preview()
+        ttk.Label(panel, text="Rotation (degrees):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        rotation_var.trace('w', update_rotation)
+        self._text_rotation_scale = tk.Scale(panel, from_=0, to=360, resolution=1,
+                                             orient=tk.HORIZONTAL, variable=v['rotation'],
+                                             **self._scale_cfg)
+        self._text_rotation_scale.pack(fill=tk.X, pady=(0, 10))
+        self._bind_drag_preview(self._text_rotation_scale)
+        self._panel_inputs.append(self._text_rotation_scale)
 
         # Layer
-        ttk.Label(self.properties_frame, text="Layer (z-order):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Layer (z-order):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        layer_var = tk.IntVar(value=getattr(text_elem, 'layer_index', 0))
-        layer_spin = tk.Spinbox(self.properties_frame, from_=-100, to=100, textvariable=layer_var, width=10,
-                               bg=self.colors['bg_light'], fg=self.colors['text'])
+        layer_spin = tk.Spinbox(panel, from_=-100, to=100, textvariable=v['layer'], width=10,
+                               **self._field_cfg)
         layer_spin.pack(anchor=tk.W, pady=(0, 10))
 
-        def update_layer(*args):
-            text_elem.layer_index = layer_var.get()
-            self._update_preview()
-            self._update_elements_list()
+        self._text_spins = {'size': size_spin, 'x': x_spin, 'y': y_spin, 'layer': layer_spin}
+        self._panel_inputs += self._text_spins.values()
 
-        layer_var.trace('w', update_layer)
+    def _show_text_properties(self, text_elem: TextElement):
+        """Show text element properties in the right sidebar"""
+        panel = self._get_props_panel('text')
+        self._clear_properties_panel()
+        page = self.brochure.pages[self.current_page_index]
+        v = self._text_vars
+        text_entry = self._text_entry
+        color_btn = self._text_color_btn
 
-    def _show_shape_properties(self, shape: ShapeElement):
-        """Show shape element properties in the right sidebar"""
-        # Clear existing properties
-        for widget in self.properties_frame.winfo_children():
-            widget.destroy()
+        # Load the element's values before any trace is attached
+        text_entry.delete('1.0', tk.END)
+        text_entry.insert('1.0', text_elem.text)
+        v['size'].set(text_elem.font_size)
+        color_btn.configure(bg=text_elem.font_color)
+        v['x'].set(int(text_elem.x))
+        v['y'].set(int(text_elem.y))
+        v['align'].set(text_elem.alignment)
+        v['rotation'].set(text_elem.rotation)
+        v['layer'].set(text_elem.layer_index)
+
+        def commit_text():
+            text_elem.text = text_entry.get('1.0', 'end-1c')
+            self._request_preview_update(page)
+            self._refresh_element_label(text_elem)
 
-        ttk.Label(self.properties_frame, text=f"{shape.shape_type.title()} Properties",
-                 style='Title.TLabel').pack(pady=(0, 10))
+        def update_text(*args):
+            self._debounce_edit('text', commit_text)
 
-        # Fill color with real-time preview
-        ttk.Label(self.properties_frame, text="Fill Color:", style='Dark.TLabel').pack(anchor=tk.W)
+        text_entry.bind('<KeyRelease>', update_text)
 
-        fill_btn = tk.Button(self.properties_frame, text="Choose Fill",
-                            bg=shape.fill_color if shape.fill_color != "transparent" else "#888888",
-                            fg='white', cursor='hand2')
-        fill_btn.pack(anchor=tk.W, pady=(0, 10))
+        def update_size(*args):
+            text_elem.font_size = v['size'].get()
+            self._request_preview_update(page)
 
-        def change_fill():
+        spins = self._text_spins
+        self._bind_spin_commit(spins['size'], update_size)
+
+        def change_color():
             def on_color_change(color):
-                shape.fill_color = color
-                fill_btn.configure(bg=color)
-                self._update_preview()
+                text_elem.font_color = color
+                color_btn.configure(bg=color)
+                self._request_preview_update(page)
 
-            initial = shape.fill_color if shape.fill_color != "transparent" else "#ffffff"
-            picker = RealTimeColorPicker(self.root, initial, on_color_change, "Fill Color")
-            result = picker.get_color()
-            if result is None:
-                # User cancelled, revert (already applied during preview)
-                pass
+            picker = RealTimeColorPicker(self.root, text_elem.font_color, on_color_change, "Text Color")
+            picker.get_color()
 
-        fill_btn.configure(command=change_fill)
+        color_btn.configure(command=change_color)
+
+        def update_pos(*args):
+            text_elem.x = v['x'].get()
+            text_elem.y = v['y'].get()
+            self._request_preview_update(page)
+
+        self._bind_spin_commit(spins['x'], update_pos)
+        self._bind_spin_commit(spins['y'], update_pos)
+
+        def update_align(*args):
+            text_elem.alignment = v['align'].get()
+            self._request_preview_update(page)
+
+        self._trace_var(v['align'], update_align)
+
+        def commit_rotation():
+            text_elem.rotation = v['rotation'].get()
+            self._request_preview_update(page)
+
+        self._text_rotation_scale.configure(
+            command=lambda value: self._on_slider_change('rotation', commit_rotation))
+
+        def update_layer(*args):
+            text_elem.layer_index = v['layer'].get()
+            self._invalidate_element_order()
+            self._request_preview_update(page)
+            self._update_elements_list()
+
+        self._bind_spin_commit(spins['layer'], update_layer)
+
+        panel.pack(fill=tk.BOTH, expand=True)
+
+    def _build_shape_props_panel(self, panel: ttk.Frame):
+        """Create the shape properties widgets once; values are loaded per selection"""
+        v = self._shape_vars = {
+            'x': tk.IntVar(),
+            'y': tk.IntVar(),
+            'w': tk.IntVar(),
+            'h': tk.IntVar(),
+            'rotation': tk.DoubleVar(),
+            'opacity': tk.DoubleVar(),
+            'layer': tk.IntVar(),
+        }
+
+        self._shape_title_label = ttk.Label(panel, style='Title.TLabel')
+        self._shape_title_label.pack(pady=(0, 10))
+
+        # Fill color with real-time preview
+        ttk.Label(panel, text="Fill Color:", style='Dark.TLabel').pack(anchor=tk.W)
+
+        self._shape_fill_btn = tk.Button(panel, text="Choose Fill", fg='white', cursor='hand2')
+        self._shape_fill_btn.pack(anchor=tk.W, pady=(0, 10))
 
         # Position
-        ttk.Label(self.properties_frame, text="Position (%):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Position (%):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        pos_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        pos_frame = ttk.Frame(panel, style='Dark.TFrame')
         pos_frame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Label(pos_frame, text="X:", style='Dark.TLabel').pack(side=tk.LEFT)
-        x_var = tk.IntVar(value=int(shape.x))
-        x_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=x_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        x_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=v['x'], width=5,
+                           **self._field_cfg)
         x_spin.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(pos_frame, text="Y:", style='Dark.TLabel').pack(side=tk.LEFT)
-        y_var = tk.IntVar(value=int(shape.y))
-        y_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=y_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        y_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=v['y'], width=5,
+                           **self._field_cfg)
         y_spin.pack(side=tk.LEFT, padx=5)
 
-        def update_pos(*args):
-            shape.x = x_var.get()
-            shape.y = y_var.get()
-            self._update_preview()
-
-        x_var.trace('w', update_pos)
-        y_var.trace('w', update_pos)
-
         # Size
-        ttk.Label(self.properties_frame, text="Size (%):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Size (%):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        size_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        size_frame = ttk.Frame(panel, style='Dark.TFrame')
         size_frame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Label(size_frame, text="W:", style='Dark.TLabel').pack(side=tk.LEFT)
-        w_var = tk.IntVar(value=int(shape.width))
-        w_spin = tk.Spinbox(size_frame, from_=1, to=100, textvariable=w_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        w_spin = tk.Spinbox(size_frame, from_=1, to=100, textvariable=v['w'], width=5,
+                           **self._field_cfg)
         w_spin.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(size_frame, text="H:", style='Dark.TLabel').pack(side=tk.LEFT)
-        h_var = tk.IntVar(value=int(shape.height))
-        h_spin = tk.Spinbox(size_frame, from_=1, to=100, textvariable=h_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        h_spin = tk.Spinbox(size_frame, from_=1, to=100, textvariable=v['h'], width=5,
+                           **self._field_cfg)
         h_spin.pack(side=tk.LEFT, padx=5)
 
-        def update_size(*args):
-            shape.width = w_var.get()
-            shape.height = h_var.get()
-            self._update_preview()
+        # Rotation
+        ttk.Label(panel, text="Rotation (degrees):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        w_var.trace('w', update_size)
-        h_var.trace('w', update_size)
+        self._shape_rotation_scale = tk.Scale(panel, from_=0, to=360, resolution=1,
+                                              orient=tk.HORIZONTAL, variable=v['rotation'],
+                                              **self._scale_cfg)
+        self._shape_rotation_scale.pack(fill=tk.X, pady=(0, 10))
+        self._bind_drag_preview(self._shape_rotation_scale)
 
-        # Rotation
-        ttk.Label(self.properties_frame, text="Rotation (degrees):", style='Dark.TLabel').pack(anchor=tk.W)
+        # Opacity
+        ttk.Label(panel, text="Opacity:", style='Dark.TLabel').pack(anchor=tk.W)
 
-        rotation_var = tk.DoubleVar(value=getattr(shape, 'rotation', 0))
-        rotation_scale = tk.Scale(self.properties_frame, from_=0, to=360, resolution=1,
-                                 orient=tk.HORIZONTAL, variable=rotation_var,
-                                 bg=self.colors['bg_dark'], fg=self.colors['text'],
-                                 highlightthickness=0, troughcolor=self.colors['bg_light'])
-        rotation_scale.pack(fill=tk.X, pady=(0, 10))
+        self._shape_opacity_scale = tk.Scale(panel, from_=0, to=1, resolution=0.1,
+                                             orient=tk.HORIZONTAL, variable=v['opacity'],
+                                             **self._scale_cfg)
+        self._shape_opacity_scale.pack(fill=tk.X, pady=(0, 10))
+        self._bind_drag_preview(self._shape_opacity_scale)
+        self._panel_inputs += [self._shape_rotation_scale, self._shape_opacity_scale]
 
-        def update_rotation(*args):
-            shape.rotation = rotation_var.get()
-            self._update_preview()
+        # Layer
+        ttk.Label(panel, text="Layer (z-order):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        rotation_var.trace('w', update_rotation)
+        layer_spin = tk.Spinbox(panel, from_=-100, to=100, textvariable=v['layer'], width=10,
+                               **self._field_cfg)
+        layer_spin.pack(anchor=tk.W, pady=(0, 10))
 
-        # Opacity
-        ttk.Label(self.properties_frame, text="Opacity:", style='Dark.TLabel').pack(anchor=tk.W)
+        self._shape_spins = {'x': x_spin, 'y': y_spin, 'w': w_spin, 'h': h_spin, 'layer': layer_spin}
+        self._panel_inputs += self._shape_spins.values()
 
-        opacity_var = tk.DoubleVar(value=shape.opacity)
-        opacity_scale = tk.Scale(self.properties_frame, from_=0, to=1, resolution=0.1,
-                                orient=tk.HORIZONTAL, variable=opacity_var,
-                                bg=self.colors['bg_dark'], fg=self.colors['text'],
-                                highlightthickness=0, troughcolor=self.colors['bg_light'])
-        opacity_scale.pack(fill=tk.X, pady=(0, 10))
+    def _show_shape_properties(self, shape: ShapeElement):
+        """Show shape element properties in the right sidebar"""
+        panel = self._get_props_panel('shape')
+        self._clear_properties_panel()
+        page = self.brochure.pages[self.current_page_index]
+        v = self._shape_vars
+        fill_btn = self._shape_fill_btn
+
+        # Load the element's values before any trace is attached
+        self._shape_title_label.configure(text=f"{shape.shape_type.title()} Properties")
+        fill_btn.configure(bg=shape.fill_color if shape.fill_color != "transparent" else "#888888")
+        v['x'].set(int(shape.x))
+        v['y'].set(int(shape.y))
+        v['w'].set(int(shape.width))
+        v['h'].set(int(shape.height))
+        v['rotation'].set(shape.rotation)
+        v['opacity'].set(shape.opacity)
+        v['layer'].set(shape.layer_index)
 
-        def update_opacity(*args):
-            shape.opacity = opacity_var.get()
-            self._update_preview()
+        def change_fill():
+            def on_color_change(color):
+                shape.fill_color = color
+                fill_btn.configure(bg=color)
+                self._request_preview_update(page)
+
+            initial = shape.fill_color if shape.fill_color != "transparent" else "#ffffff"
+            picker = RealTimeColorPicker(self.root, initial, on_color_change, "Fill Color")
+            result = picker.get_color()
+            if result is None:
+                # User cancelled, revert (already applied during preview)
+                pass
+
+        fill_btn.configure(command=change_fill)
 
-        opacity_var.trace('w', update_opacity)
+        def update_pos(*args):
+            shape.x = v['x'].get()
+            shape.y = v['y'].get()
+            self._request_preview_update(page)
 
-        # Layer
-        ttk.Label(self.properties_frame, text="Layer (z-order):", style='Dark.TLabel').pack(anchor=tk.W)
+        spins = self._shape_spins
+        self._bind_spin_commit(spins['x'], update_pos)
+        self._bind_spin_commit(spins['y'], update_pos)
 
-        layer_var = tk.IntVar(value=getattr(shape, 'layer_index', 0))
-        layer_spin = tk.Spinbox(self.properties_frame, from_=-100, to=100, textvariable=layer_var, width=10,
-                               bg=self.colors['bg_light'], fg=self.colors['text'])
-        layer_spin.pack(anchor=tk.W, pady=(0, 10))
+        def update_size(*args):
+            shape.width = v['w'].get()
+            shape.height = v['h'].get()
+            self._request_preview_update(page)
+
+        self._bind_spin_commit(spins['w'], update_size)
+        self._bind_spin_commit(spins['h'], update_size)
+
+        def commit_rotation():
+            shape.rotation = v['rotation'].get()
+            self._request_preview_update(page)
+
+        self._shape_rotation_scale.configure(
+            command=lambda value: self._on_slider_change('rotation', commit_rotation))
+
+        def commit_opacity():
+            shape.opacity = v['opacity'].get()
+            self._request_preview_update(page)
+
+        self._shape_opacity_scale.configure(
+            command=lambda value: self._on_slider_change('opacity', commit_opacity))
 
         def update_layer(*args):
-            shape.layer_index = layer_var.get()
-            self._update_preview()
+            shape.layer_index = v['layer'].get()
+            self._invalidate_element_order()
+            self._request_preview_update(page)
             self._update_elements_list()
 
-        layer_var.trace('w', update_layer)
+        self._bind_spin_commit(spins['layer'], update_layer)
+
+        panel.pack(fill=tk.BOTH, expand=True)
 
     def _import_image(self):
         """Import an image file and add it to the current page"""
@@ -2085,15 +2513,16 @@ A5 booklet with pages in order.
             filetypes=filetypes
         )
 
-        if filepath:
+        if not filepath:
+            return
+
+        with self._batch_updates():
             # Create image element
             page = self.brochure.pages[self.current_page_index]
 
-            # Get max layer index to place new image on top
-            max_layer = 0
-            for elem in page.shape_elements + page.text_elements + page.image_elements:
-                layer = getattr(elem, 'layer_index', 0)
-                max_layer = max(max_layer, layer)
+            # Place the new image above the current top layer; the cached rows are sorted by layer
+            rows = self._get_sorted_elements(page)
+            max_layer = max(0, rows[-1][2]) if rows else 0
 
             new_image = ImageElement(
                 image_path=filepath,
@@ -2107,143 +2536,160 @@ A5 booklet with pages in order.
                 layer_index=max_layer + 1
             )
             page.image_elements.append(new_image)
+            self._invalidate_element_order(page)
+            self._bump(page)
 
             self._update_preview()
             self._update_elements_list()
 
-    def _show_image_properties(self, image_elem: ImageElement):
-        """Show image element properties in the right sidebar"""
-        # Clear existing properties
-        for widget in self.properties_frame.winfo_children():
-            widget.destroy()
+    def _build_image_props_panel(self, panel: ttk.Frame):
+        """Create the image properties widgets once; values are loaded per selection"""
+        # The numeric spinboxes have no variables; they are read directly when a value is committed
+        v = self._image_vars = {
+            'rotation': tk.DoubleVar(),
+            'opacity': tk.DoubleVar(),
+            'fit': tk.StringVar(),
+        }
 
-        name = os.path.basename(image_elem.image_path) if image_elem.image_path else "Image"
-        ttk.Label(self.properties_frame, text=f"Image: {name[:20]}",
-                 style='Title.TLabel').pack(pady=(0, 10))
+        self._image_title_label = ttk.Label(panel, style='Title.TLabel')
+        self._image_title_label.pack(pady=(0, 10))
 
         # Position
-        ttk.Label(self.properties_frame, text="Position (%):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Position (%):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        pos_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        pos_frame = ttk.Frame(panel, style='Dark.TFrame')
         pos_frame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Label(pos_frame, text="X:", style='Dark.TLabel').pack(side=tk.LEFT)
-        x_var = tk.IntVar(value=int(image_elem.x))
-        x_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=x_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        x_spin = tk.Spinbox(pos_frame, from_=0, to=100, width=5, **self._field_cfg)
         x_spin.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(pos_frame, text="Y:", style='Dark.TLabel').pack(side=tk.LEFT)
-        y_var = tk.IntVar(value=int(image_elem.y))
-        y_spin = tk.Spinbox(pos_frame, from_=0, to=100, textvariable=y_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        y_spin = tk.Spinbox(pos_frame, from_=0, to=100, width=5, **self._field_cfg)
         y_spin.pack(side=tk.LEFT, padx=5)
 
-        def update_pos(*args):
-            image_elem.x = x_var.get()
-            image_elem.y = y_var.get()
-            self._update_preview()
-
-        x_var.trace('w', update_pos)
-        y_var.trace('w', update_pos)
-
         # Size
-        ttk.Label(self.properties_frame, text="Size (%):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Size (%):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        size_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        size_frame = ttk.Frame(panel, style='Dark.TFrame')
         size_frame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Label(size_frame, text="W:", style='Dark.TLabel').pack(side=tk.LEFT)
-        w_var = tk.IntVar(value=int(image_elem.width))
-        w_spin = tk.Spinbox(size_frame, from_=1, to=100, textvariable=w_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        w_spin = tk.Spinbox(size_frame, from_=1, to=100, width=5, **self._field_cfg)
         w_spin.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(size_frame, text="H:", style='Dark.TLabel').pack(side=tk.LEFT)
-        h_var = tk.IntVar(value=int(image_elem.height))
-        h_spin = tk.Spinbox(size_frame, from_=1, to=100, textvariable=h_var, width=5,
-                           bg=self.colors['bg_light'], fg=self.colors['text'])
+        h_spin = tk.Spinbox(size_frame, from_=1, to=100, width=5, **self._field_cfg)
         h_spin.pack(side=tk.LEFT, padx=5)
 
-        def update_size(*args):
-            image_elem.width = w_var.get()
-            image_elem.height = h_var.get()
-            self._update_preview()
-
-        w_var.trace('w', update_size)
-        h_var.trace('w', update_size)
-
         # Rotation
-        ttk.Label(self.properties_frame, text="Rotation (degrees):", style='Dark.TLabel').pack(anchor=tk.W)
-
-        rotation_var = tk.DoubleVar(value=getattr(image_elem, 'rotation', 0))
-        rotation_scale = tk.Scale(self.properties_frame, from_=0, to=360, resolution=1,
-                                 orient=tk.HORIZONTAL, variable=rotation_var,
-                                 bg=self.colors['bg_dark'], fg=self.colors['text'],
-                                 highlightthickness=0, troughcolor=self.colors['bg_light'])
-        rotation_scale.pack(fill=tk.X, pady=(0, 10))
-
-        def update_rotation(*args):
-            image_elem.rotation = rotation_var.get()
-            self._update_preview()
+        ttk.Label(panel, text="Rotation (degrees):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        rotation_var.trace('w', update_rotation)
+        self._image_rotation_scale = tk.Scale(panel, from_=0, to=360, resolution=1,
+                                              orient=tk.HORIZONTAL, variable=v['rotation'],
+                                              **self._scale_cfg)
+        self._image_rotation_scale.pack(fill=tk.X, pady=(0, 10))
+        self._bind_drag_preview(self._image_rotation_scale)
 
         # Opacity
-        ttk.Label(self.properties_frame, text="Opacity:", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Opacity:", style='Dark.TLabel').pack(anchor=tk.W)
 
-        opacity_var = tk.DoubleVar(value=image_elem.opacity)
-        opacity_scale = tk.Scale(self.properties_frame, from_=0, to=1, resolution=0.1,
-                                orient=tk.HORIZONTAL, variable=opacity_var,
-                                bg=self.colors['bg_dark'], fg=self.colors['text'],
-                                highlightthickness=0, troughcolor=self.colors['bg_light'])
-        opacity_scale.pack(fill=tk.X, pady=(0, 10))
-
-        def update_opacity(*args):
-            image_elem.opacity = opacity_var.get()
-            self._update_preview()
-
-        opacity_var.trace('w', update_opacity)
+        self._image_opacity_scale = tk.Scale(panel, from_=0, to=1, resolution=0.1,
+                                             orient=tk.HORIZONTAL, variable=v['opacity'],
+                                             **self._scale_cfg)
+        self._image_opacity_scale.pack(fill=tk.X, pady=(0, 10))
+        self._bind_drag_preview(self._image_opacity_scale)
+        self._panel_inputs += [self._image_rotation_scale, self._image_opacity_scale]
 
         # Fit mode
-        ttk.Label(self.properties_frame, text="Fit Mode:", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Fit Mode:", style='Dark.TLabel').pack(anchor=tk.W)
 
-        fit_var = tk.StringVar(value=image_elem.fit_mode)
-        fit_frame = ttk.Frame(self.properties_frame, style='Dark.TFrame')
+        fit_frame = ttk.Frame(panel, style='Dark.TFrame')
         fit_frame.pack(fill=tk.X, pady=(0, 10))
 
         for mode in ["contain", "cover", "stretch"]:
-            rb = tk.Radiobutton(fit_frame, text=mode.title(), variable=fit_var,
-                               value=mode, bg=self.colors['bg_dark'], fg=self.colors['text'],
-                               selectcolor=self.colors['bg_light'])
+            rb = tk.Radiobutton(fit_frame, text=mode.title(), variable=v['fit'],
+                               value=mode, **self._radio_cfg)
             rb.pack(side=tk.LEFT)
 
-        def update_fit(*args):
-            image_elem.fit_mode = fit_var.get()
-            self._update_preview()
-
-        fit_var.trace('w', update_fit)
-
         # Layer
-        ttk.Label(self.properties_frame, text="Layer (z-order):", style='Dark.TLabel').pack(anchor=tk.W)
+        ttk.Label(panel, text="Layer (z-order):", style='Dark.TLabel').pack(anchor=tk.W)
 
-        layer_var = tk.IntVar(value=getattr(image_elem, 'layer_index', 0))
-        layer_spin = tk.Spinbox(self.properties_frame, from_=-100, to=100, textvariable=layer_var, width=10,
-                               bg=self.colors['bg_light'], fg=self.colors['text'])
+        layer_spin = tk.Spinbox(panel, from_=-100, to=100, width=10, **self._field_cfg)
         layer_spin.pack(anchor=tk.W, pady=(0, 10))
 
-        def update_layer(*args):
-            image_elem.layer_index = layer_var.get()
-            self._update_preview()
-            self._update_elements_list()
-
-        layer_var.trace('w', update_layer)
+        self._image_spins = {'x': x_spin, 'y': y_spin, 'w': w_spin, 'h': h_spin, 'layer': layer_spin}
+        self._panel_inputs += self._image_spins.values()
 
         # Replace image button
-        replace_btn = tk.Button(self.properties_frame, text="Replace Image",
-                               bg=self.colors['bg_light'], fg='white',
-                               cursor='hand2')
-        replace_btn.pack(fill=tk.X, pady=5)
+        self._image_replace_btn = tk.Button(panel, text="Replace Image", **self._dark_btn)
+        self._image_replace_btn.pack(fill=tk.X, pady=5)
+        self._panel_inputs.append(self._image_replace_btn)
+
+    def _show_image_properties(self, image_elem: ImageElement):
+        """Show image element properties in the right sidebar"""
+        panel = self._get_props_panel('image')
+        self._clear_properties_panel()
+        page = self.brochure.pages[self.current_page_index]
+        v = self._image_vars
+
+        # Load the element's values before any trace is attached
+        name = os.path.basename(image_elem.image_path) if image_elem.image_path else "Image"
+        self._image_title_label.configure(text=f"Image: {name[:20]}")
+        spins = self._image_spins
+        values = {'x': int(image_elem.x), 'y': int(image_elem.y), 'w': int(image_elem.width),
+                  'h': int(image_elem.height), 'layer': image_elem.layer_index}
+        for key, value in values.items():
+            spins[key].delete(0, tk.END)
+            spins[key].insert(0, str(value))
+        v['rotation'].set(image_elem.rotation)
+        v['opacity'].set(image_elem.opacity)
+        v['fit'].set(image_elem.fit_mode)
+
+        attrs = {'x': 'x', 'y': 'y', 'w': 'width', 'h': 'height', 'layer': 'layer_index'}
+
+        def apply_geometry(*args):
+            # Each spinbox is parsed on its own, so a partially typed field (e.g. an emptied W)
+            # doesn't hold back the others; fields still showing the element's value are left alone
+            changed = set()
+            for key, attr in attrs.items():
+                try:
+                    value = int(spins[key].get())
+                except ValueError:
+                    continue
+                if value != int(getattr(image_elem, attr)):
+                    setattr(image_elem, attr, value)
+                    changed.add(key)
+
+            if not changed:
+                return
+            if 'layer' in changed:
+                self._invalidate_element_order()
+                self._update_elements_list()
+            self._request_preview_update(page)
+
+        for spin in spins.values():
+            self._bind_spin_commit(spin, apply_geometry)
+
+        def commit_rotation():
+            image_elem.rotation = v['rotation'].get()
+            self._request_preview_update(page)
+
+        self._image_rotation_scale.configure(
+            command=lambda value: self._on_slider_change('rotation', commit_rotation))
+
+        def commit_opacity():
+            image_elem.opacity = v['opacity'].get()
+            self._request_preview_update(page)
+
+        self._image_opacity_scale.configure(
+            command=lambda value: self._on_slider_change('opacity', commit_opacity))
+
+        def update_fit(*args):
+            image_elem.fit_mode = v['fit'].get()
+            self._schedule_preview(30, page)
+
+        self._trace_var(v['fit'], update_fit)
 
         def replace_image():
             filetypes = [
@@ -2254,41 +2700,55 @@ A5 booklet with pages in order.
             if filepath:
                 image_elem.image_path = filepath
                 image_elem.image_data = None
-                self._update_preview()
-                self._update_elements_list()
+                name = os.path.basename(filepath)
+                self._image_title_label.configure(text=f"Image: {name[:20]}")
+                self._request_preview_update(page)
+                self._refresh_element_label(image_elem)
+
+        self._image_replace_btn.configure(command=replace_image)
 
-        replace_btn.configure(command=replace_image)
+        panel.pack(fill=tk.BOTH, expand=True)
 
     def _delete_selected_element(self):
         """Delete the selected element"""
-        if not self.selected_element:
-            return
+        with self._batch_updates():
+            if not self.selected_element:
+                return
 
-        page = self.brochure.pages[self.current_page_index]
-        elem_type, idx = self.selected_element
-
-        if elem_type == 'shape' and idx < len(page.shape_elements):
-            page.shape_elements.pop(idx)
-        elif elem_type == 'image' and idx < len(page.image_elements):
-            page.image_elements.pop(idx)
-        elif elem_type == 'text' and idx < len(page.text_elements):
-            page.text_elements.pop(idx)
-
-        self.selected_element = None
-        self._update_preview()
-        self._update_elements_list()
+            page = self.brochure.pages[self.current_page_index]
+            elem_type, idx = self.selected_element
+
+            if elem_type == 'shape' and idx < len(page.shape_elements):
+                page.shape_elements.pop(idx)
+            elif elem_type == 'image' and idx < len(page.image_elements):
+                page.image_elements.pop(idx)
+            elif elem_type == 'text' and idx < len(page.text_elements):
+                page.text_elements.pop(idx)
+            self._invalidate_element_order(page)
+            self._bump(page)
+
+            self.selected_element = None
+            self._update_preview()
+            self._update_elements_list()
 
-        # Reset properties panel
-        for widget in self.properties_frame.winfo_children():
-            widget.destroy()
-        self.no_selection_label = ttk.Label(self.properties_frame,
-                                            text="Select an element\nto edit its properties",
-                                            style='Dark.TLabel')
-        self.no_selection_label.pack(pady=50)
+            # Reset properties panel
+            self._clear_properties_panel()
+            self.no_selection_label.pack(pady=50)
 
     def _on_canvas_resize(self, event):
-        """Handle canvas resize"""
-        self._update_preview()
+        """Handle canvas resize, redrawing once the window stops changing size"""
+        # Tk also sends <Configure> for moves and restacking, which don't change the preview
+        size = (event.width, event.height)
+        if size == self._canvas_size:
+            return
+        self._canvas_size = size
+        self._schedule_preview(RESIZE_DEBOUNCE_MS)
+
+    def _on_window_map(self, event):
+        """Redraw the preview when the main window is shown again after being minimized"""
+        # Every widget carries the toplevel's bindtag, so ignore their own <Map> events
+        if event.widget is self.root:
+            self._request_preview_update()
 
     def _on_canvas_click(self, event):
         """Handle canvas click for element selection"""
@@ -2298,15 +2758,76 @@ A5 booklet with pages in order.
         """Handle canvas drag for element movement"""
         pass  # TODO: Implement drag-to-move
 
+    def _bump(self, page: Optional[PageData] = None):
+        """Mark a page (or every page) as edited so the next preview redraw isn't skipped"""
+        for p in ([page] if page is not None else self.brochure.pages):
+            p.version += 1
+
+    def _mark_preview_dirty(self, page: Optional[PageData]) -> bool:
+        """Bump the edited page, if any; True if a redraw should be scheduled now (not batching)"""
+        if page is not None:
+            self._bump(page)
+        if self._batch_depth:
+            self._batch_dirty.add('preview')
+            return False
+        return True
+
+    def _schedule_preview(self, delay: int, page: Optional[PageData] = None):
+        """Debounce a preview redraw: each call pushes the pending redraw back to `delay` ms from now
+
+        Pass the edited page to bump its version in the same call.
+        """
+        if not self._mark_preview_dirty(page):
+            return
+        if self._pending_redraw is not None:
+            self.root.after_cancel(self._pending_redraw)
+        self._pending_redraw = self.root.after(delay, self._do_update_preview)
+
+    def _request_preview_update(self, page: Optional[PageData] = None):
+        """Schedule a preview redraw, coalescing rapid edits into one redraw per frame
+
+        Pass the edited page to bump its version in the same call.
+        """
+        if not self._mark_preview_dirty(page):
+            return
+        # A redraw already queued will pick up the latest state, so don't push it back
+        if self._pending_redraw is None:
+            self._pending_redraw = self.root.after(16, self._do_update_preview)
+
+    def _do_update_preview(self):
+        """Run the scheduled preview redraw"""
+        self._pending_redraw = None
+        self._update_preview()
+
     def _update_preview(self):
         """Update the preview canvas"""
-        self.preview_canvas.delete('all')
+        if self._batch_depth:
+            self._batch_dirty.add('preview')
+            return
+
+        # Nothing to show while minimized or withdrawn; _last_render_key is left alone, and
+        # anything edited meanwhile changes it, so the redraw on restore isn't skipped
+        if not self.preview_canvas.winfo_viewable():
+            return
 
         canvas_width = self.preview_canvas.winfo_width()
         canvas_height = self.preview_canvas.winfo_height()
 
-        if canvas_width <= 1 or canvas_height <= 1:
+        # Skip the redraw when nothing shown on the canvas has changed since the last one
+        render_key = (self.preview_mode, canvas_width, canvas_height, self.current_page_index,
+                      self._dragging, tuple((id(p), p.version) for p in self.brochure.pages))
+        if render_key == self._last_render_key:
+            return
+
+        # Canvas items persist across redraws; whatever this redraw doesn't touch is hidden
+        self._drawn_items = set()
+        self._restacking = False
+
+        if canvas_width < MIN_PREVIEW_CANVAS or canvas_height < MIN_PREVIEW_CANVAS:
+            self._last_render_key = None
+            self._hide_undrawn_items()
             return
+        self._last_render_key = render_key
 
         if self.preview_mode == "single":
             self._render_single_page_preview(canvas_width, canvas_height)
@@ -2315,6 +2836,100 @@ A5 booklet with pages in order.
         else:  # print
             self._render_print_preview(canvas_width, canvas_height)
 
+        self._hide_undrawn_items()
+
+    def _draw(self, key: str, kind: str, *coords, **options):
+        """Create the preview canvas item `key`, or move and reconfigure it if it already exists"""
+        canvas = self.preview_canvas
+        item = self._canvas_items.get(key)
+        args = (coords, options)
+        self._drawn_items.add(key)
+        if item is None:
+            self._canvas_items[key] = getattr(canvas, f'create_{kind}')(*coords, **options)
+            self._restacking = True
+        elif self._restacking or self._item_args.get(key) != args:
+            canvas.coords(item, *coords)
+            canvas.itemconfigure(item, state='normal', **options)
+            # Keep stacking in draw order, as if the item had just been created
+            canvas.tag_raise(item)
+            self._restacking = True
+        else:
+            # Drawn exactly like this last time and nothing below it moved; e.g. the untouched
+            # half of a spread keeps its item as is (a refilled PhotoImage updates by itself)
+            return
+        self._item_args[key] = args
+
+    def _hide_undrawn_items(self):
+        """Hide preview canvas items the current redraw didn't draw (e.g. another mode's items)"""
+        for key, item in self._canvas_items.items():
+            if key not in self._drawn_items:
+                self.preview_canvas.itemconfigure(item, state='hidden')
+                self._item_args.pop(key, None)
+
+    def _render_page_cached(self, page: PageData, width: int, height: int, exact: bool = False) -> Image.Image:
+        """Render a page at the given preview size, reusing earlier renders of the unchanged page
+
+        A miss is scaled down from a larger cached render of the same page version when there is
+        one (e.g. on a resize or mode switch), and rasterized directly at the requested size
+        otherwise, so edits never pay for more pixels than the canvas shows. Pass exact=True for
+        throwaway renders (half-resolution drag frames): they are rasterized at the requested
+        size and not cached.
+        """
+        entry = self._page_cache.get(id(page))
+        # The page itself is stored too, since id() can be reused after a page is discarded;
+        # renders of an older version can never be shown again, so they are dropped
+        if entry is None or entry[0] is not page or entry[1] != page.version:
+            self._page_cache.pop(id(page), None)
+            renders = OrderedDict()
+            if not exact:
+                self._page_cache[id(page)] = (page, page.version, renders)
+        else:
+            renders = entry[2]
+            self._page_cache.move_to_end(id(page))
+
+        img = renders.get((width, height))
+        if img is not None:
+            renders.move_to_end((width, height))
+            return img
+
+        # Smallest cached render of this version that can be shrunk to the requested size
+        source = None
+        if not exact:
+            for (w, h), cached_img in renders.items():
+                if w >= width and h >= height and (source is None or w * h < source.width * source.height):
+                    source = cached_img
+
+        if source is not None:
+            img = source.resize((width, height), Image.Resampling.BILINEAR)
+        else:
+            self.renderer.width = width
+            self.renderer.height = height
+            img = self.renderer.render_page(page)
+
+        if not exact:
+            renders[(width, height)] = img
+            if len(renders) > PAGE_CACHE_SIZES:
+                renders.popitem(last=False)
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return img
+
+    def _photo_for(self, attr: str, img: Image.Image):
+        """Point a PhotoImage attribute at img, converting only if it shows a different render
+
+        Unchanged pages come back from the page cache as the same image object, so e.g. editing
+        one side of a spread leaves the other side's PhotoImage untouched. A PhotoImage of the
+        right size is refilled in place with paste() instead of allocating a new Tk image.
+        """
+        if self._photo_sources.get(attr) is img:
+            return
+        photo = getattr(self, attr)
+        if photo is not None and (photo.width(), photo.height()) == img.size:
+            photo.paste(img)
+        else:
+            setattr(self, attr, ImageTk.PhotoImage(img))
+        self._photo_sources[attr] = img
+
     def _render_single_page_preview(self, canvas_width, canvas_height):
         """Render single page preview"""
         if self.current_page_index >= len(self.brochure.pages):
@@ -2337,23 +2952,25 @@ A5 booklet with pages in order.
             preview_width = max_width
             preview_height = int(preview_width / aspect_ratio)
 
-        # Render page
-        self.renderer.width = preview_width
-        self.renderer.height = preview_height
-
-        img = self.renderer.render_page(page)
+        # Render page; while a slider is dragged render a quarter of the pixels and scale up
+        if self._dragging:
+            img = self._render_page_cached(page, max(1, preview_width // 2), max(1, preview_height // 2),
+                                           exact=True)
+            img = img.resize((preview_width, preview_height), Image.Resampling.NEAREST)
+        else:
+            img = self._render_page_cached(page, preview_width, preview_height)
 
         # Center on canvas
         x = (canvas_width - preview_width) // 2
         y = (canvas_height - preview_height) // 2
 
         # Convert to PhotoImage and display
-        self.preview_image = ImageTk.PhotoImage(img)
-        self.preview_canvas.create_image(x, y, anchor=tk.NW, image=self.preview_image)
+        self._photo_for('preview_image', img)
+        self._draw('single_image', 'image', x, y, anchor=tk.NW, image=self.preview_image)
 
         # Draw border
-        self.preview_canvas.create_rectangle(x, y, x + preview_width, y + preview_height,
-                                            outline=self.colors['text_dim'], width=1)
+        self._draw('single_border', 'rectangle', x, y, x + preview_width, y + preview_height,
+                   outline=self.colors.text_dim, width=1)
 
         # Page number indicator
         self.info_label.configure(
@@ -2361,7 +2978,7 @@ A5 booklet with pages in order.
 
     def _render_spread_preview(self, canvas_width, canvas_height):
         """Render spread (two facing pages) preview"""
-        spreads = BookletImposition.get_spread_pairs(self.brochure.page_count)
+        spreads = self._get_spread_pairs()
         spread_idx = min(self.current_page_index // 2, len(spreads) - 1)
 
         if spread_idx >= len(spreads):
@@ -2387,50 +3004,47 @@ A5 booklet with pages in order.
 
         page_width = (total_width - gap) // 2
 
-        self.renderer.width = page_width
-        self.renderer.height = preview_height
-
         # Starting position
         x_start = (canvas_width - total_width) // 2
         y = (canvas_height - preview_height) // 2
 
         # Render left page
         if left_idx >= 0 and left_idx < len(self.brochure.pages):
-            left_img = self.renderer.render_page(self.brochure.pages[left_idx])
-            self.spread_left_image = ImageTk.PhotoImage(left_img)
-            self.preview_canvas.create_image(x_start, y, anchor=tk.NW, image=self.spread_left_image)
-            self.preview_canvas.create_rectangle(x_start, y, x_start + page_width, y + preview_height,
-                                                outline=self.colors['text_dim'], width=1)
+            left_img = self._render_page_cached(self.brochure.pages[left_idx], page_width, preview_height)
+            self._photo_for('spread_left_image', left_img)
+            self._draw('spread_left_image', 'image', x_start, y, anchor=tk.NW, image=self.spread_left_image)
+            self._draw('spread_left_border', 'rectangle', x_start, y, x_start + page_width, y + preview_height,
+                       outline=self.colors.text_dim, width=1)
             # Page label
-            self.preview_canvas.create_text(x_start + page_width // 2, y + preview_height + 15,
-                                           text=f"Page {left_idx + 1}", fill=self.colors['text_dim'])
+            self._draw('spread_left_label', 'text', x_start + page_width // 2, y + preview_height + 15,
+                       text=f"Page {left_idx + 1}", fill=self.colors.text_dim)
         else:
             # Blank page
-            self.preview_canvas.create_rectangle(x_start, y, x_start + page_width, y + preview_height,
-                                                fill=self.colors['bg_light'],
-                                                outline=self.colors['text_dim'], width=1)
+            self._draw('spread_left_blank', 'rectangle', x_start, y, x_start + page_width, y + preview_height,
+                       fill=self.colors.bg_light,
+                       outline=self.colors.text_dim, width=1)
 
         # Render right page
         right_x = x_start + page_width + gap
         if right_idx >= 0 and right_idx < len(self.brochure.pages):
-            right_img = self.renderer.render_page(self.brochure.pages[right_idx])
-            self.spread_right_image = ImageTk.PhotoImage(right_img)
-            self.preview_canvas.create_image(right_x, y, anchor=tk.NW, image=self.spread_right_image)
-            self.preview_canvas.create_rectangle(right_x, y, right_x + page_width, y + preview_height,
-                                                outline=self.colors['text_dim'], width=1)
+            right_img = self._render_page_cached(self.brochure.pages[right_idx], page_width, preview_height)
+            self._photo_for('spread_right_image', right_img)
+            self._draw('spread_right_image', 'image', right_x, y, anchor=tk.NW, image=self.spread_right_image)
+            self._draw('spread_right_border', 'rectangle', right_x, y, right_x + page_width, y + preview_height,
+                       outline=self.colors.text_dim, width=1)
             # Page label
-            self.preview_canvas.create_text(right_x + page_width // 2, y + preview_height + 15,
-                                           text=f"Page {right_idx + 1}", fill=self.colors['text_dim'])
+            self._draw('spread_right_label', 'text', right_x + page_width // 2, y + preview_height + 15,
+                       text=f"Page {right_idx + 1}", fill=self.colors.text_dim)
         else:
             # Blank page
-            self.preview_canvas.create_rectangle(right_x, y, right_x + page_width, y + preview_height,
-                                                fill=self.colors['bg_light'],
-                                                outline=self.colors['text_dim'], width=1)
+            self._draw('spread_right_blank', 'rectangle', right_x, y, right_x + page_width, y + preview_height,
+                       fill=self.colors.bg_light,
+                       outline=self.colors.text_dim, width=1)
 
         # Center fold line
         fold_x = x_start + page_width + gap // 2
-        self.preview_canvas.create_line(fold_x, y - 10, fold_x, y + preview_height + 10,
-                                        fill=self.colors['accent'], dash=(4, 4))
+        self._draw('spread_fold', 'line', fold_x, y - 10, fold_x, y + preview_height + 10,
+                   fill=self.colors.accent, dash=(4, 4))
 
         self.info_label.configure(text=f"Spread: {description}")
 
@@ -2457,16 +3071,13 @@ A5 booklet with pages in order.
         page_width = sheet_width // 2
         page_height = sheet_height
 
-        self.renderer.width = page_width
-        self.renderer.height = page_height
-
         # Center position
         x_start = (canvas_width - sheet_width) // 2
         y = (canvas_height - sheet_height) // 2
 
         # Draw A4 sheet background
-        self.preview_canvas.create_rectangle(x_start, y, x_start + sheet_width, y + sheet_height,
-                                            fill='white', outline=self.colors['text_dim'], width=2)
+        self._draw('print_sheet', 'rectangle', x_start, y, x_start + sheet_width, y + sheet_height,
+                   fill='white', outline=self.colors.text_dim, width=2)
 
         # Get current sheet (based on current page index)
         sheet_idx = min(self.current_page_index // 2, (len(imposition) - 1) // 2) * 2
@@ -2475,24 +3086,24 @@ A5 booklet with pages in order.
 
             # Render left half
             if left_idx >= 0 and left_idx < len(self.brochure.pages):
-                left_img = self.renderer.render_page(self.brochure.pages[left_idx])
-                self.print_left_image = ImageTk.PhotoImage(left_img)
-                self.preview_canvas.create_image(x_start, y, anchor=tk.NW, image=self.print_left_image)
-                self.preview_canvas.create_text(x_start + page_width // 2, y + page_height + 15,
-                                               text=f"Page {left_idx + 1}", fill=self.colors['text'])
+                left_img = self._render_page_cached(self.brochure.pages[left_idx], page_width, page_height)
+                self._photo_for('print_left_image', left_img)
+                self._draw('print_left_image', 'image', x_start, y, anchor=tk.NW, image=self.print_left_image)
+                self._draw('print_left_label', 'text', x_start + page_width // 2, y + page_height + 15,
+                           text=f"Page {left_idx + 1}", fill=self.colors.text)
 
             # Render right half
             if right_idx >= 0 and right_idx < len(self.brochure.pages):
-                right_img = self.renderer.render_page(self.brochure.pages[right_idx])
-                self.print_right_image = ImageTk.PhotoImage(right_img)
-                self.preview_canvas.create_image(x_start + page_width, y, anchor=tk.NW, image=self.print_right_image)
-                self.preview_canvas.create_text(x_start + page_width + page_width // 2, y + page_height + 15,
-                                               text=f"Page {right_idx + 1}", fill=self.colors['text'])
+                right_img = self._render_page_cached(self.brochure.pages[right_idx], page_width, page_height)
+                self._photo_for('print_right_image', right_img)
+                self._draw('print_right_image', 'image', x_start + page_width, y, anchor=tk.NW, image=self.print_right_image)
+                self._draw('print_right_label', 'text', x_start + page_width + page_width // 2, y + page_height + 15,
+                           text=f"Page {right_idx + 1}", fill=self.colors.text)
 
         # Center fold line
         fold_x = x_start + page_width
-        self.preview_canvas.create_line(fold_x, y, fold_x, y + page_height,
-                                        fill=self.colors['accent'], dash=(4, 4), width=2)
+        self._draw('print_fold', 'line', fold_x, y, fold_x, y + page_height,
+                   fill=self.colors.accent, dash=(4, 4), width=2)
 
         # Sheet info
         total_sheets = (len(imposition) + 1) // 2
@@ -2504,12 +3115,20 @@ A5 booklet with pages in order.
 
     def _export_pdf(self):
         """Export brochure as print-ready PDF with imposition"""
+        # Export what the panel shows, including a value still being typed
+        self._flush_pending_edits()
+        self._commit_focused_spin()
+
         if not HAS_REPORTLAB:
             messagebox.showerror("Error",
                 "PDF export requires the 'reportlab' library.\n"
                 "Install it with: pip install reportlab")
             return
 
+        if self._pdf_export_running:
+            messagebox.showinfo("Export in progress", "A PDF export is still running, please wait for it to finish.")
+            return
+
         # Ask for save location
         filename = filedialog.asksaveasfilename(
             defaultextension=".pdf",
@@ -2520,49 +3139,80 @@ A5 booklet with pages in order.
         if not filename:
             return
 
-        try:
-            self._generate_pdf(filename)
+        def on_success():
             messagebox.showinfo("Success", f"PDF saved to:\n{filename}\n\n"
                               "Print double-sided, flip on short edge.\n"
                               "Then nest sheets and fold to create booklet.")
-        except Exception as e:
+
+        def on_error(e):
             messagebox.showerror("Error", f"Failed to export PDF:\n{str(e)}")
 
-    def _generate_pdf(self, filename: str):
-        """Generate the PDF with proper imposition"""
-        # Use high resolution renderer
-        export_renderer = BrochureRenderer(preview_mode=False)
+        try:
+            self._generate_pdf(filename, on_success, on_error)
+        except Exception as e:
+            on_error(e)
+
+    def _generate_pdf(self, filename: str, on_success: Callable[[], None],
+                      on_error: Callable[[Exception], None]):
+        """Generate the PDF with proper imposition in the background
 
+        Pages render at export resolution in worker processes while the Tk loop keeps running;
+        a root.after() poll writes each sheet side in imposition order as soon as its pages are
+        done, then calls on_success, or on_error if anything fails.
+        """
         # Create PDF with A4 landscape pages
         c = canvas.Canvas(filename, pagesize=(A4[1], A4[0]))  # Landscape A4
 
         imposition = BookletImposition.get_imposition_order(self.brochure.page_count)
+        # Workers get a snapshot, so the brochure can be edited while the export runs
+        pages = copy.deepcopy(self.brochure.pages)
+        page_count = sum(1 for side in imposition for idx in side if 0 <= idx < len(pages))
+
+        def submit(pool, idx):
+            # Pixels come back raw and go to reportlab as PIL images, no PNG round-trip
+            if 0 <= idx < len(pages):
+                return pool.submit(render_page_to_rgb_bytes, pages[idx], A5_EXPORT_WIDTH, A5_EXPORT_HEIGHT)
+            return None
+
+        pool = ProcessPoolExecutor(max_workers=max(1, min(os.cpu_count() or 1, page_count)))
+        futures = [(submit(pool, left_idx), submit(pool, right_idx)) for left_idx, right_idx in imposition]
+
+        self._pdf_export_running = True
+        position = 0  # next sheet side to write
+
+        def finish(error: Optional[Exception] = None):
+            pool.shutdown(wait=error is None, cancel_futures=True)
+            self._pdf_export_running = False
+            # Put the preview's own info text back in place of the progress message
+            self._last_render_key = None
+            self._request_preview_update()
+            if error is None:
+                on_success()
+            else:
+                on_error(error)
 
-        for i, (left_idx, right_idx) in enumerate(imposition):
-            # Render pages at export resolution
-            page_width = A5_EXPORT_WIDTH
-            page_height = A5_EXPORT_HEIGHT
-
-            export_renderer.width = page_width
-            export_renderer.height = page_height
+        def write_side(i):
+            # Take the futures out of the list so this call holds the only references and each
+            # page's pixels are freed as soon as it is drawn
+            left_future, right_future = futures[i]
+            futures[i] = None
 
             # Left page
-            if left_idx >= 0 and left_idx < len(self.brochure.pages):
-                left_img = export_renderer.render_page(self.brochure.pages[left_idx])
-                left_buffer = io.BytesIO()
-                left_img.save(left_buffer, format='PNG')
-                left_buffer.seek(0)
-                left_reader = ImageReader(left_buffer)
+            if left_future is not None:
+                left_img = Image.frombytes('RGB', (A5_EXPORT_WIDTH, A5_EXPORT_HEIGHT), left_future.result())
+                left_reader = ImageReader(left_img)
                 c.drawImage(left_reader, 0, 0, width=A4[1]/2, height=A4[0])
+                # The canvas keeps its own encoded copy, drop ours before the next page arrives
+                left_img.close()
+                del left_future, left_reader, left_img
 
             # Right page
-            if right_idx >= 0 and right_idx < len(self.brochure.pages):
-                right_img = export_renderer.render_page(self.brochure.pages[right_idx])
-                right_buffer = io.BytesIO()
-                right_img.save(right_buffer, format='PNG')
-                right_buffer.seek(0)
-                right_reader = ImageReader(right_buffer)
+            if right_future is not None:
+                right_img = Image.frombytes('RGB', (A5_EXPORT_WIDTH, A5_EXPORT_HEIGHT), right_future.result())
+                right_reader = ImageReader(right_img)
                 c.drawImage(right_reader, A4[1]/2, 0, width=A4[1]/2, height=A4[0])
+                right_img.close()
+                del right_future, right_reader, right_img
 
             # Add crop marks (optional)
             c.setStrokeColor(HexColor('#CCCCCC'))
@@ -2573,10 +3223,35 @@ A5 booklet with pages in order.
             if i < len(imposition) - 1:
                 c.showPage()
 
-        c.save()
+        def poll():
+            nonlocal position
+            try:
+                # Write every sheet side whose pages are ready, stopping at the first pending one
+                while position < len(futures):
+                    if any(fut is not None and not fut.done() for fut in futures[position]):
+                        break
+                    write_side(position)
+                    position += 1
+
+                if position == len(futures):
+                    c.save()
+                    finish()
+                    return
+            except Exception as e:
+                finish(e)
+                return
+
+            self.info_label.configure(text=f"Exporting sheet side {position + 1}/{len(imposition)}...")
+            self.root.after(EXPORT_POLL_MS, poll)
+
+        poll()
 
     def _export_images(self):
         """Export individual pages as images"""
+        # Export what the panel shows, including a value still being typed
+        self._flush_pending_edits()
+        self._commit_focused_spin()
+
         # Ask for save directory
         directory = filedialog.askdirectory(title="Select folder to save images")
 
@@ -2584,12 +3259,22 @@ A5 booklet with pages in order.
             return
 
         try:
+            # Local, so its full-resolution buffers are freed once the export is done
             export_renderer = BrochureRenderer(preview_mode=False)
 
-            for i, page in enumerate(self.brochure.pages):
-                img = export_renderer.render_page(page)
-                filepath = os.path.join(directory, f"page_{i+1:02d}.png")
-                img.save(filepath, 'PNG', dpi=(300, 300))
+            # PIL releases the GIL while encoding and writing, so each page is saved on a
+            # worker thread while the next one renders; fast zlib level, the output is lossless anyway
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                saves = []
+                for i, page in enumerate(self.brochure.pages):
+                    img = export_renderer.render_page(page)
+                    filepath = os.path.join(directory, f"page_{i+1:02d}.png")
+                    saves.append(pool.submit(img.save, filepath, 'PNG', dpi=(300, 300),
+                                             optimize=False, compress_level=1))
+
+                # Surface the first failed write, if any
+                for save in saves:
+                    save.result()
 
             messagebox.showinfo("Success", f"Exported {len(self.brochure.pages)} pages to:\n{directory}")
         except Exception as e:
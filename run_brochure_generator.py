@@ -7,30 +7,19 @@ This script checks for required dependencies and launches the application.
 
 import sys
 import subprocess
+import importlib
+import importlib.util
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    missing = []
-
-    # Check tkinter
-    try:
-        import tkinter
-    except ImportError:
-        missing.append("tkinter (included with Python on most systems)")
-
-    # Check Pillow
-    try:
-        from PIL import Image
-    except ImportError:
-        missing.append("Pillow")
-
-    # Check reportlab
-    try:
-        import reportlab
-    except ImportError:
-        missing.append("reportlab")
-
-    return missing
+    # find_spec only locates the modules, so the check doesn't pay for importing them.
+    # tkinter is looked up by its C extension, which distro Pythons may ship separately
+    required = [
+        ("_tkinter", "tkinter (included with Python on most systems)"),
+        ("PIL", "Pillow"),
+        ("reportlab", "reportlab"),
+    ]
+    return [name for module, name in required if importlib.util.find_spec(module) is None]
 
 
 def install_dependencies():
@@ -38,6 +27,8 @@ def install_dependencies():
     print("Installing required packages...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow", "reportlab"])
     print("Installation complete!")
+    # Let find_spec see the freshly installed packages
+    importlib.invalidate_caches()
 
 
 def main():